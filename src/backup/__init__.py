@@ -1,5 +1,5 @@
 """Backup management for XLIFF files."""
 
-from .backup_manager import BackupManager
+from .backup_manager import BackupManager, BackupInfo
 
-__all__ = ['BackupManager']
+__all__ = ['BackupManager', 'BackupInfo']
@@ -3,10 +3,235 @@ Backup manager for XLIFF files.
 Creates timestamped backups before modifications.
 """
 
+import ctypes
+import errno
+import functools
+import heapq
+import logging
+import os
 import shutil
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from time import localtime
+from typing import Optional, List, Tuple, Iterator
+
+log = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Below this many files, a thread pool costs more than it saves
+PARALLEL_UNLINK_THRESHOLD = 16
+
+# Backup names have one-second resolution; a name already taken within the
+# same second gets a -1, -2, ... counter, up to this many attempts
+BACKUP_NAME_ATTEMPTS = 100
+
+# ioctl request number for FICLONE (reflink clone on btrfs/xfs)
+FICLONE = 0x40049409
+
+# Errors meaning "this copy mechanism is not supported here, try the next one"
+_COPY_FALLBACK_ERRNOS = {
+    errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL,
+    errno.ENOTTY, errno.ENOSYS, errno.EBADF,
+}
+
+
+# statx(2) constants (linux/stat.h, fcntl.h)
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_MTIME = 0x0040
+STATX_CTIME = 0x0080
+STATX_SIZE = 0x0200
+
+# Subset of os.stat_result fields returned by _statx()
+StatxResult = namedtuple(
+    'StatxResult', ['st_size', 'st_mtime', 'st_mtime_ns', 'st_ctime', 'st_ctime_ns']
+)
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('_reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32),
+        ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32),
+        ('stx_dev_minor', ctypes.c_uint32),
+        ('_spare3', ctypes.c_uint64 * 14),  # struct statx is 256 bytes
+    ]
+
+
+def _load_statx():
+    """Return the libc statx function, or None if unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):  # glibc < 2.28, musl, ...
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                     ctypes.c_uint, ctypes.POINTER(_Statx)]
+    func.restype = ctypes.c_int
+    return func
+
+
+_libc_statx = _load_statx()
+
+# None until the first call; then whether statx worked on this system
+_HAVE_STATX = None if _libc_statx else False
+
+
+def _statx(path: str, mask: int):
+    """
+    Stat a file, asking the kernel only for the fields in mask.
+
+    Uses statx(2) with AT_STATX_DONT_SYNC on Linux and falls back to os.stat()
+    elsewhere, or when the filesystem does not supply the requested fields.
+
+    Returns:
+        StatxResult or os.stat_result (both expose st_size/st_mtime/st_ctime
+        and their _ns variants)
+
+    Raises:
+        OSError: If the file cannot be stat'ed (e.g. FileNotFoundError)
+    """
+    global _HAVE_STATX
+    if _HAVE_STATX is False:
+        return os.stat(path)
+
+    buf = _Statx()
+    if _libc_statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC,
+                   mask, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EPERM) and _HAVE_STATX is None:
+            # Kernel too old, or statx blocked by a seccomp filter
+            _HAVE_STATX = False
+            return os.stat(path)
+        raise OSError(err, os.strerror(err), path)
+
+    _HAVE_STATX = True
+    if buf.stx_mask & mask != mask:
+        return os.stat(path)
+
+    mt, ct = buf.stx_mtime, buf.stx_ctime
+    mtime_ns = mt.tv_sec * 1_000_000_000 + mt.tv_nsec
+    ctime_ns = ct.tv_sec * 1_000_000_000 + ct.tv_nsec
+    return StatxResult(buf.stx_size, mtime_ns / 1e9, mtime_ns, ctime_ns / 1e9, ctime_ns)
+
+
+def _safe_unlink(path: str) -> bool:
+    """Delete a file, returning False (and logging) on failure."""
+    try:
+        os.unlink(path)
+        return True
+    except OSError as e:
+        log.warning("Failed to delete %s: %s", path, e)
+        return False
+
+
+def _timestamp() -> str:
+    """Current local time formatted as YYYYMMDD_HHMMSS."""
+    t = localtime()
+    return (f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_"
+            f"{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}")
+
+
+@dataclass(slots=True, frozen=True)
+class BackupInfo:
+    """Metadata about a backup file."""
+    path: str
+    name: str
+    size: int
+    created_ns: int  # st_ctime in nanoseconds
+    modified_ns: int  # st_mtime in nanoseconds
+
+    @property
+    def created(self) -> str:
+        """Creation time as an ISO 8601 string."""
+        return datetime.fromtimestamp(self.created_ns / 1e9).isoformat()
+
+    @property
+    def modified(self) -> str:
+        """Modification time as an ISO 8601 string."""
+        return datetime.fromtimestamp(self.modified_ns / 1e9).isoformat()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_name(file_path: str) -> Tuple[str, str, str]:
+    """
+    Split a path into (parent, stem, suffix) without building a Path.
+
+    parent is '' for the current directory, so paths joined onto it stay
+    relative like the input.
+    """
+    parent, name = os.path.split(file_path)
+    stem, suffix = os.path.splitext(name)
+    return parent, stem, suffix
+
+
+class _SiblingStrategy:
+    """Backups next to the original file: originalname_backup_YYYYMMDD_HHMMSS.ext"""
+
+    __slots__ = ()
+
+    def search(self, original_file: str) -> Tuple[str, str, str]:
+        """Return (backup_root, name_prefix, name_suffix) for original_file."""
+        parent, stem, suffix = _split_name(original_file)
+        return parent, f"{stem}_backup_", suffix
+
+    def prepare(self) -> None:
+        """Nothing to set up; the original file's directory exists."""
+
+
+class _DirStrategy:
+    """Backups in a dedicated directory: originalname_YYYYMMDD_HHMMSS.ext"""
+
+    __slots__ = ('root',)
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def search(self, original_file: str) -> Tuple[str, str, str]:
+        """Return (backup_root, name_prefix, name_suffix) for original_file."""
+        _, stem, suffix = _split_name(original_file)
+        return self.root, f"{stem}_", suffix
+
+    def prepare(self) -> None:
+        """Create the backup directory if needed."""
+        try:
+            os.mkdir(self.root)
+        except FileExistsError:
+            pass
 
 
 class BackupManager:
@@ -14,14 +239,24 @@ class BackupManager:
     Manages backups of XLIFF files before modifications.
     """
 
-    def __init__(self, backup_dir: Optional[str] = None):
+    __slots__ = ('backup_dir', 'link_ok', '_strategy')
+
+    def __init__(self, backup_dir: Optional[str] = None, link_ok: bool = False):
         """
         Initialize backup manager.
 
         Args:
             backup_dir: Directory for backups. If None, creates backup next to original file
+            link_ok: Create backups as hard links when source and backup are on the
+                same filesystem. Only safe if files are modified by writing a new file
+                and renaming it over the original; XLIFFParser.save() and
+                TMXParser.save() rewrite in place, so this is off by default.
         """
         self.backup_dir = Path(backup_dir) if backup_dir else None
+        self.link_ok = link_ok
+        self._strategy = (
+            _DirStrategy(os.fspath(self.backup_dir)) if self.backup_dir else _SiblingStrategy()
+        )
 
     def create_backup(self, file_path: str) -> Optional[str]:
         """
@@ -34,35 +269,214 @@ class BackupManager:
             Path to backup file, or None if backup failed
         """
         try:
-            source_path = Path(file_path)
+            for attempt in range(BACKUP_NAME_ATTEMPTS):
+                backup_path = self._new_backup_path(file_path, attempt)
+
+                # Link or copy file; never overwrite an existing backup
+                try:
+                    if not (self.link_ok and self._link(file_path, backup_path)):
+                        self._fast_copy(file_path, backup_path, exclusive=True)
+                except FileExistsError:
+                    continue  # Name taken within the same second, try the next one
+                except FileNotFoundError as e:
+                    if e.filename != file_path:
+                        raise
+                    log.error("Source file does not exist: %s", file_path)
+                    return None
+
+                log.info("Backup created: %s", backup_path)
+                return backup_path
+
+            log.error("No free backup name for %s", file_path)
+            return None
+
+        except Exception:
+            log.exception("Backup failed")
+            return None
+
+    def _new_backup_path(self, file_path: str, attempt: int = 0) -> str:
+        """
+        Build a timestamped backup path for file_path, creating the
+        backup directory if needed.
+
+        A non-zero attempt appends "-N" to the timestamp, for when the plain
+        name is already taken. The separator is not "_", so restore_backup()
+        still derives the original name from the last two "_" fields.
+        """
+        backup_root, prefix, suffix = self._strategy.search(file_path)
+        self._strategy.prepare()
+        counter = f"-{attempt}" if attempt else ""
+        return os.path.join(backup_root, f"{prefix}{_timestamp()}{counter}{suffix}")
+
+    def _move_aside(self, file_path: str) -> Optional[str]:
+        """
+        Turn the current file into a backup by moving it, without copying data.
 
-            if not source_path.exists():
-                print(f"Source file does not exist: {file_path}")
+        The move is a hard link to the backup name followed by an unlink of
+        the file. Unlike rename(), link() fails instead of replacing a backup
+        that took the same name in the meantime; taken names are retried with
+        a counter suffix. Falls back to copying via create_backup() when hard
+        links are not possible (another filesystem, or no link support).
+
+        Returns:
+            Path the file was moved to, or None if it was not moved
+        """
+        for attempt in range(BACKUP_NAME_ATTEMPTS):
+            pre_path = self._new_backup_path(file_path, attempt)
+            try:
+                os.link(file_path, pre_path)
+            except FileExistsError:
+                continue  # Name taken within the same second, try the next one
+            except FileNotFoundError:
+                # Nothing to back up
                 return None
+            except OSError:
+                # EXDEV (cross-device), EPERM/ENOTSUP (no hard links): copy instead
+                break
+            os.unlink(file_path)
+            log.info("Backup created: %s", pre_path)
+            return pre_path
+
+        if os.path.exists(file_path):
+            self.create_backup(file_path)
+        return None
+
+    @staticmethod
+    def _link(src: str, dst: str) -> bool:
+        """
+        Hard link dst to src. Returns False if linking is not possible here
+        (different filesystems, or a filesystem without hard links).
+        """
+        try:
+            os.link(src, dst)
+            return True
+        except (FileNotFoundError, FileExistsError):
+            raise
+        except OSError:
+            return False
 
-            # Determine backup location
-            if self.backup_dir:
-                # Use specified backup directory
-                backup_root = self.backup_dir
-                backup_root.mkdir(exist_ok=True)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_name = f"{source_path.stem}_{timestamp}{source_path.suffix}"
-                backup_path = backup_root / backup_name
-            else:
-                # Place backup next to original file with _backup suffix
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_name = f"{source_path.stem}_backup_{timestamp}{source_path.suffix}"
-                backup_path = source_path.parent / backup_name
+    @staticmethod
+    def _fast_copy(src: str, dst: str, exclusive: bool = False) -> None:
+        """
+        Copy src to dst, preserving metadata like shutil.copy2.
 
-            # Copy file
-            shutil.copy2(source_path, backup_path)
+        Tries a reflink clone (FICLONE), then copy_file_range, then sendfile,
+        and finally falls back to a buffered userspace copy.
 
-            print(f"Backup created: {backup_path}")
-            return str(backup_path)
+        Args:
+            src: Source file path
+            dst: Destination file path
+            exclusive: Fail with FileExistsError instead of overwriting dst
+        """
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, flags, 0o666)
+            try:
+                if not (BackupManager._clone(src_fd, dst_fd)
+                        or BackupManager._copy_range(src_fd, dst_fd)
+                        or BackupManager._sendfile(src_fd, dst_fd)):
+                    with open(src_fd, 'rb', closefd=False) as fsrc, \
+                            open(dst_fd, 'wb', closefd=False) as fdst:
+                        shutil.copyfileobj(fsrc, fdst, length=256 * 1024)
+            except BaseException:
+                os.close(dst_fd)
+                if exclusive:
+                    # Don't leave a truncated backup behind
+                    os.unlink(dst)
+                raise
+            os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        shutil.copystat(src, dst)
+
+    @staticmethod
+    def _clone(src_fd: int, dst_fd: int) -> bool:
+        """Clone file contents via FICLONE. Returns False if unsupported."""
+        if fcntl is None:
+            return False
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return True
+        except OSError as e:
+            if e.errno in _COPY_FALLBACK_ERRNOS:
+                return False
+            raise
 
-        except Exception as e:
-            print(f"Backup failed: {e}")
-            return None
+    @staticmethod
+    def _copy_range(src_fd: int, dst_fd: int) -> bool:
+        """Copy file contents in-kernel via copy_file_range. Returns False if unsupported."""
+        if not hasattr(os, 'copy_file_range'):
+            return False
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, 2 ** 30)
+                if n == 0:
+                    # Some filesystems (procfs-like, some FUSE mounts) report
+                    # 0 without copying; let the next strategy try
+                    return copied > 0 or os.fstat(src_fd).st_size == 0
+                copied += n
+        except OSError as e:
+            # Only fall back if nothing was written yet
+            if copied == 0 and e.errno in _COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+
+    @staticmethod
+    def _sendfile(src_fd: int, dst_fd: int) -> bool:
+        """Copy file contents in-kernel via sendfile. Returns False if unsupported."""
+        if not hasattr(os, 'sendfile') or not sys.platform.startswith('linux'):
+            # Other platforms only support sendfile to sockets
+            return False
+        size = os.fstat(src_fd).st_size
+        offset = 0
+        try:
+            while offset < size:
+                n = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if n == 0:
+                    if offset == 0:
+                        return False  # Nothing copied, let copyfileobj try
+                    break
+                offset += n
+        except OSError as e:
+            if offset == 0 and e.errno in _COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+        return True
+
+    def _iter_backups(self, original_file: str) -> Iterator[Tuple[int, str]]:
+        """
+        Scan the backup directory for backups of a given file.
+
+        Yields:
+            (mtime_ns, backup_path) tuples, in directory order
+
+        Raises:
+            FileNotFoundError: If the backup directory does not exist
+        """
+        backup_root, prefix, suffix = self._strategy.search(original_file)
+        min_len = len(prefix) + len(suffix)
+        join = os.path.join
+
+        with os.scandir(backup_root or '.') as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix) and len(name) >= min_len:
+                    yield _statx(entry.path, STATX_MTIME).st_mtime_ns, join(backup_root, name)
+
+    def _scan_backups(self, original_file: str) -> List[Tuple[int, str]]:
+        """
+        Find all backups for a given file.
+
+        Returns:
+            Unsorted list of (mtime_ns, backup_path) tuples
+        """
+        try:
+            return list(self._iter_backups(original_file))
+        except FileNotFoundError:
+            return []
 
     def list_backups(self, original_file: str) -> List[str]:
         """
@@ -75,33 +489,31 @@ class BackupManager:
             List of backup file paths, sorted by date (newest first)
         """
         try:
-            source_path = Path(original_file)
-
-            if self.backup_dir:
-                backup_root = self.backup_dir
-                if not backup_root.exists():
-                    return []
-                # Find backups matching the original filename pattern
-                pattern = f"{source_path.stem}_*{source_path.suffix}"
-                backups = sorted(
-                    backup_root.glob(pattern),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True
-                )
-            else:
-                # Find backups next to original file with _backup suffix
-                backup_root = source_path.parent
-                pattern = f"{source_path.stem}_backup_*{source_path.suffix}"
-                backups = sorted(
-                    backup_root.glob(pattern),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True
-                )
-
-            return [str(b) for b in backups]
-
-        except Exception as e:
-            print(f"Error listing backups: {e}")
+            entries = self._scan_backups(original_file)
+            entries.sort(key=itemgetter(0), reverse=True)
+            return [path for _, path in entries]
+
+        except Exception:
+            log.exception("Error listing backups")
+            return []
+
+    def list_recent_backups(self, original_file: str, n: int) -> List[str]:
+        """
+        List the n most recent backups for a given file.
+
+        Args:
+            original_file: Path to original file
+            n: Maximum number of backups to return
+
+        Returns:
+            List of backup file paths, sorted by date (newest first)
+        """
+        try:
+            entries = self._scan_backups(original_file)
+            return [path for _, path in heapq.nlargest(n, entries, key=itemgetter(0))]
+
+        except Exception:
+            log.exception("Error listing backups")
             return []
 
     def restore_backup(self, backup_path: str, target_path: Optional[str] = None) -> bool:
@@ -116,43 +528,48 @@ class BackupManager:
             True if successful
         """
         try:
-            backup = Path(backup_path)
-
-            if not backup.exists():
-                print(f"Backup file does not exist: {backup_path}")
+            if not os.path.exists(backup_path):
+                log.error("Backup file does not exist: %s", backup_path)
                 return False
 
             if target_path:
-                target = Path(target_path)
+                target = target_path
             else:
                 # Derive original filename from backup
                 # Format: originalname_backup_YYYYMMDD_HHMMSS.ext
-                if '_backup_' in backup.stem:
+                backup = Path(backup_path)
+                bstem, bparent, bsuffix = backup.stem, backup.parent, backup.suffix
+                if '_backup_' in bstem:
                     # New format: next to file with _backup_ suffix
-                    original_name = backup.stem.split('_backup_')[0]
-                    target = backup.parent / f"{original_name}{backup.suffix}"
+                    original_name = bstem.split('_backup_')[0]
+                    target = str(bparent / f"{original_name}{bsuffix}")
                 else:
                     # Old format: in .backups folder (for backwards compatibility)
-                    parts = backup.stem.split('_')
+                    parts = bstem.split('_')
                     if len(parts) >= 3:
                         original_name = '_'.join(parts[:-2])
-                        target = backup.parent.parent / f"{original_name}{backup.suffix}"
+                        target = str(bparent.parent / f"{original_name}{bsuffix}")
                     else:
-                        print("Cannot determine original filename from backup")
+                        log.error("Cannot determine original filename from backup")
                         return False
 
-            # Create backup of current file before restoring (if it exists)
-            if target.exists():
-                self.create_backup(str(target))
+            # Move current file out of the way as a backup before restoring
+            # (if it exists). A rename moves no data, unlike a backup copy.
+            moved_to = self._move_aside(target)
 
             # Restore backup
-            shutil.copy2(backup, target)
-
-            print(f"Backup restored: {backup_path} -> {target}")
+            try:
+                self._fast_copy(backup_path, target)
+            except BaseException:
+                if moved_to:
+                    os.replace(moved_to, target)
+                raise
+
+            log.info("Backup restored: %s -> %s", backup_path, target)
             return True
 
-        except Exception as e:
-            print(f"Restore failed: {e}")
+        except Exception:
+            log.exception("Restore failed")
             return False
 
     def cleanup_old_backups(self, original_file: str, keep_count: int = 10) -> int:
@@ -167,50 +584,68 @@ class BackupManager:
             Number of backups deleted
         """
         try:
-            backups = self.list_backups(original_file)
+            # Single pass: keep the newest keep_count in a min-heap; anything
+            # pushed out of it is older than all survivors and gets deleted
+            survivors = []
+            victims = []
+            try:
+                for entry in self._iter_backups(original_file):
+                    if len(survivors) < keep_count:
+                        heapq.heappush(survivors, entry)
+                    else:
+                        victims.append(heapq.heappushpop(survivors, entry)[1])
+            except FileNotFoundError:
+                return 0
 
-            if len(backups) <= keep_count:
+            if not victims:
                 return 0
 
             # Delete oldest backups
-            deleted = 0
-            for backup in backups[keep_count:]:
-                try:
-                    Path(backup).unlink()
-                    deleted += 1
-                except Exception as e:
-                    print(f"Failed to delete {backup}: {e}")
+            deleted = self._unlink_all(victims)
 
-            print(f"Deleted {deleted} old backups")
+            log.info("Deleted %d old backups", deleted)
             return deleted
 
-        except Exception as e:
-            print(f"Cleanup failed: {e}")
+        except Exception:
+            log.exception("Cleanup failed")
             return 0
 
-    def get_backup_info(self, backup_path: str) -> dict:
+    @staticmethod
+    def _unlink_all(paths: List[str]) -> int:
         """
-        Get information about a backup file.
+        Delete a batch of files.
+
+        Large batches are deleted on a small thread pool so the unlink
+        syscalls (and their journal waits) overlap.
 
         Returns:
-            Dictionary with backup metadata
+            Number of files deleted
         """
-        try:
-            backup = Path(backup_path)
+        if len(paths) < PARALLEL_UNLINK_THRESHOLD:
+            return sum(map(_safe_unlink, paths))
 
-            if not backup.exists():
-                return {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return sum(executor.map(_safe_unlink, paths))
 
-            stat = backup.stat()
+    def get_backup_info(self, backup_path: str) -> Optional[BackupInfo]:
+        """
+        Get information about a backup file.
 
-            return {
-                'path': str(backup),
-                'size': stat.st_size,
-                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'name': backup.name
-            }
+        Returns:
+            BackupInfo, or None if the backup does not exist or cannot be read
+        """
+        try:
+            stat = _statx(backup_path, STATX_SIZE | STATX_MTIME | STATX_CTIME)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            log.exception("Error getting backup info")
+            return None
 
-        except Exception as e:
-            print(f"Error getting backup info: {e}")
-            return {}
+        return BackupInfo(
+            path=backup_path,
+            name=os.path.basename(backup_path),
+            size=stat.st_size,
+            created_ns=stat.st_ctime_ns,
+            modified_ns=stat.st_mtime_ns,
+        )
@@ -5,9 +5,19 @@ Provides testing interface for the backend functionality.
 """
 
 import argparse
+import contextlib
+import functools
+import multiprocessing
+import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Optional, List, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,6 +32,48 @@ from validators.icu_validator import ICUValidator
 from qa.qa_profile import QAProfileManager, QAProfile
 import json
 
+try:
+    import orjson  # Optional: much faster serialization of large GUI payloads
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: stream large apply-edits payloads record by record
+except ImportError:
+    ijson = None
+
+# Namespace map for SDLXLIFF <sdl:seg-defs> lookups
+_SDL_NS = {'sdl': 'http://sdl.com/FileTypes/SdlXliff/1.0'}
+
+# Batch-find only spreads checks over worker processes when the profile and
+# file are big enough to pay for the pool start-up. Spawned workers (macOS,
+# Windows, PyInstaller builds) each re-import the tool, ~0.2 s apiece; with
+# four workers the pool costs up to ~0.8 s, against ~20 ms when forked.
+# Checks run at 400-3000 ns per character of target text, so below ~2M
+# characters the serial run is usually done before the pool is up. Each
+# check is one task, so with fewer checks the speed-up stays too small.
+PARALLEL_MIN_CHECKS = 4
+PARALLEL_MIN_CHECK_CHARS = 2_000_000
+
+# Replace runs a single pattern at ~100 ns per character and sends every
+# text back from the workers, so it needs ~10M characters to cover the same
+# pool start-up
+PARALLEL_MIN_REPLACE_CHARS = 10_000_000
+
+# Target texts shared with each pool worker once, via the initializer
+_worker_texts: List[str] = []
+
+# Replace settings shared with each pool worker once, via the initializer
+_worker_replace: tuple = ()
+
+# Checks with the same flags are also searched as one alternation to find the
+# units that can match any of them. Patterns relying on group numbers or
+# inline flags would change meaning inside it, so they are never combined.
+# Neither are patterns with backtracking verbs such as (*SKIP), (*PRUNE) or
+# (*F): they act on the whole alternation, not just their own branch, and
+# can make it fail where another check of the group would match.
+_UNCOMBINABLE_RE = re.compile(r'\\[1-9gk]|\(\?(?![:=!>#|]|<[=!]|P?<[A-Za-z_])|\(\*')
+
 
 def get_parser(file_path: str, target_lang: str = None):
     """Return the appropriate parser based on file extension."""
@@ -30,6 +82,292 @@ def get_parser(file_path: str, target_lang: str = None):
     return XLIFFParser(file_path)
 
 
+def _print_json(data, indent: bool = False, ensure_ascii: bool = True) -> None:
+    """
+    Print data to stdout as a single line (or indented) JSON document.
+
+    Uses orjson when installed, writing UTF-8 bytes straight to stdout
+    instead of building an intermediate str. Falls back to the json module.
+    orjson never escapes non-ASCII, so ensure_ascii only affects the fallback.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=option))
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data, ensure_ascii=ensure_ascii, indent=2 if indent else None))
+
+
+def _compile_check(regex_proc: RegexProcessor, pattern: str, flags: int,
+                   exclude: Optional[str] = None):
+    """
+    Compile a search pattern and its optional exclude pattern once,
+    so they can be reused for every translation unit.
+
+    Returns:
+        Tuple of (compiled_pattern, compiled_exclude or None)
+
+    Raises:
+        regex.error: If either pattern is invalid
+    """
+    compiled = regex_proc.compile(pattern, flags)
+    compiled_exclude = regex_proc.compile(exclude, flags) if exclude else None
+    return compiled, compiled_exclude
+
+
+def _mq_timestamp(value: str) -> Optional[str]:
+    """Format a MemoQ timestamp, ignoring the 0001-01-01 placeholder."""
+    if value.startswith('0001'):
+        return None
+    return value.replace('T', ' ').replace('Z', '')
+
+
+def _phrase_timestamp(value: str) -> str:
+    """Format a Phrase millisecond timestamp, keeping the raw value if invalid."""
+    try:
+        return datetime.fromtimestamp(int(value) / 1000).strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError, OverflowError, OSError):
+        # Not a number, or out of the platform's timestamp range
+        return value
+
+
+def _phrase_yes_no(value: str) -> str:
+    return 'yes' if value == '1' else 'no'
+
+
+def _phrase_locked(value: str) -> str:
+    return 'yes' if value.lower() == 'true' or value == '1' else 'no'
+
+
+def _phrase_score(value: str) -> str:
+    return str(int(float(value) * 100))
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_metadata_attr(attr_name: str):
+    """
+    Map a trans-unit attribute name to its MemoQ and Phrase metadata rules.
+
+    Attribute names repeat across every unit of a file, so the substring
+    checks only run once per distinct name.
+
+    Returns:
+        Tuple of (memoq_rule, phrase_rule), each (metadata_key, converter)
+        or None. A converter of None keeps the raw value.
+    """
+    name = attr_name.lower()
+
+    # MemoQ MQXLIFF specific metadata (mq: namespace)
+    if 'status' in name and 'mq' in name:
+        memoq_rule = ('state', None)
+    elif 'percent' in name and 'mq' in name:
+        memoq_rule = ('match_percent', None)
+    elif 'lastchanginguser' in name:
+        memoq_rule = ('modified_by', None)
+    elif 'lastchangedtimestamp' in name:
+        memoq_rule = ('modified_date', _mq_timestamp)
+    elif 'translatorcommitusername' in name:
+        memoq_rule = ('created_by', None)
+    elif 'translatorcommittimestamp' in name:
+        memoq_rule = ('created_date', _mq_timestamp)
+    else:
+        memoq_rule = None
+
+    # Phrase MXLIFF specific metadata ({Memsource} or m: namespace)
+    if 'confirmed' in name:
+        phrase_rule = ('approved', _phrase_yes_no)
+    elif 'score' in name and 'gross' not in name:
+        phrase_rule = ('match_percent', _phrase_score)
+    elif 'locked' in name:
+        phrase_rule = ('locked', _phrase_locked)
+    elif 'modified-at' in name:
+        phrase_rule = ('modified_date', _phrase_timestamp)
+    elif 'modified-by' in name:
+        phrase_rule = ('modified_by', None)
+    elif 'created-at' in name:
+        phrase_rule = ('created_date', _phrase_timestamp)
+    elif 'created-by' in name:
+        phrase_rule = ('created_by', None)
+    elif 'trans-origin' in name:
+        phrase_rule = ('origin', None)
+    else:
+        phrase_rule = None
+
+    return memoq_rule, phrase_rule
+
+
+def _init_check_worker(texts: List[str]) -> None:
+    """Store the target texts in a pool worker."""
+    global _worker_texts
+    _worker_texts = texts
+
+
+def _find_check_matches(pattern, exclude_pattern, indices, replacement):
+    """Run one compiled check over the worker's target texts."""
+    return RegexProcessor().find_in_texts(
+        _worker_texts, pattern, ignore_tags=True, exclude_pattern=exclude_pattern,
+        indices=indices, replacement=replacement)
+
+
+def _init_replace_worker(pattern, replacement: str, ignore_tags: bool,
+                         max_replacements: int, exclude_pattern) -> None:
+    """Store the replace settings in a pool worker."""
+    global _worker_replace
+    _worker_replace = (pattern, replacement, ignore_tags, max_replacements, exclude_pattern)
+
+
+def _replace_chunk(texts: List[str]) -> List[Tuple[str, int]]:
+    """Run the worker's replacement over a chunk of target texts."""
+    return _replace_texts(RegexProcessor(), texts, *_worker_replace)
+
+
+def _replace_texts(regex_proc: RegexProcessor, texts: List[str], pattern, replacement: str,
+                   ignore_tags: bool, max_replacements: int, exclude_pattern) -> List[Tuple[str, int]]:
+    """Replace in each text; empty texts are left as they are."""
+    return [regex_proc.replace_in_text(text, pattern, replacement, ignore_tags=ignore_tags,
+                                       max_replacements=max_replacements,
+                                       exclude_pattern=exclude_pattern)
+            if text else (text, 0)
+            for text in texts]
+
+
+def _replace_in_texts(regex_proc: RegexProcessor, texts: List[str], pattern, replacement: str,
+                      ignore_tags: bool = True, max_replacements: int = 0,
+                      exclude_pattern=None) -> List[Tuple[str, int]]:
+    """
+    Run one replacement over many target texts.
+
+    Texts are independent of each other (max_replacements applies per text),
+    so on large files they are split into chunks and spread over a process
+    pool. Results keep the text order.
+
+    Returns:
+        List of (new_text, replacement_count) tuples, one per text
+    """
+    workers = os.cpu_count() or 1
+    if workers > 1 and sum(map(len, texts)) >= PARALLEL_MIN_REPLACE_CHARS:
+        chunk_size = max(1, len(texts) // (workers * 4))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_replace_worker,
+                                     initargs=(pattern, replacement, ignore_tags,
+                                               max_replacements, exclude_pattern)) as executor:
+                return [result for chunk in executor.map(_replace_chunk, chunks)
+                        for result in chunk]
+        except (OSError, BrokenProcessPool):
+            pass  # No usable pool here, replace in-process
+
+    return _replace_texts(regex_proc, texts, pattern, replacement,
+                          ignore_tags, max_replacements, exclude_pattern)
+
+
+def _preview_template(replacement: Optional[str]) -> Optional[str]:
+    """Convert a check's $1, $2 replacement to a \\1, \\2 template, or None."""
+    if not replacement:
+        return None
+    return re.sub(r'\$(\d+)', r'\\\1', replacement)
+
+
+def _candidate_indices(regex_proc: RegexProcessor, compiled_checks, texts: List[str]):
+    """
+    Find, per check, the units worth searching.
+
+    Combinable checks are grouped by flags and joined into a single
+    alternation. A unit where the alternation finds nothing cannot match any
+    check of the group, so each unit is scanned once per group instead of
+    once per check.
+
+    Returns:
+        List with, for each compiled check, an ascending list of text
+        indices, or None to search all texts
+    """
+    groups = {}
+    for position, (check, compiled, _, error) in enumerate(compiled_checks):
+        if error is None and not _UNCOMBINABLE_RE.search(check.pattern):
+            groups.setdefault(compiled.flags, []).append(position)
+
+    candidates = [None] * len(compiled_checks)
+    plain_texts = None
+    for flags, positions in groups.items():
+        if len(positions) < 2:
+            continue
+        try:
+            combined = regex_proc.compile(
+                '|'.join(f'(?:{compiled_checks[p][0].pattern})' for p in positions), flags)
+        except regex_proc.regex_module.error:
+            continue  # Keep searching these checks on every unit
+
+        if plain_texts is None:
+            plain_texts = [regex_proc.get_plain_text(text) if text else '' for text in texts]
+        indices = [i for i, text in enumerate(texts) if text and combined.search(plain_texts[i])]
+        for p in positions:
+            candidates[p] = indices
+
+    return candidates
+
+
+def _run_checks(regex_proc: RegexProcessor, checks, texts: List[str], preview: bool = False):
+    """
+    Compile every check and find its matches in the given target texts.
+
+    Units that cannot match are skipped via _candidate_indices. Checks are
+    independent of each other, so on large profiles and files they are
+    spread over a process pool. Results keep the check order.
+
+    Args:
+        regex_proc: Regex processor to compile the checks with
+        checks: Checks to run
+        texts: Target text of each unit
+        preview: If True, each match also carries the check's replacement
+            expanded for it (see RegexProcessor.find_in_texts)
+
+    Returns:
+        List of (check, compiled_pattern, error, matches) tuples. For an
+        invalid pattern, compiled_pattern and matches are None and error
+        holds the message.
+    """
+    compiled_checks = []
+    for check in checks:
+        flags = 0 if check.case_sensitive else regex_proc.regex_module.IGNORECASE
+        try:
+            compiled, compiled_exclude = _compile_check(
+                regex_proc, check.pattern, flags, check.exclude_pattern)
+            compiled_checks.append((check, compiled, compiled_exclude, None))
+        except regex_proc.regex_module.error as e:
+            compiled_checks.append((check, None, None, str(e)))
+
+    candidates = _candidate_indices(regex_proc, compiled_checks, texts)
+    valid = [(compiled, compiled_exclude, indices,
+              _preview_template(check.replacement) if preview else None)
+             for (check, compiled, compiled_exclude, error), indices in zip(compiled_checks, candidates)
+             if error is None]
+
+    results = None
+    workers = os.cpu_count() or 1
+    if (workers > 1 and len(valid) >= PARALLEL_MIN_CHECKS
+            and sum(map(len, texts)) >= PARALLEL_MIN_CHECK_CHARS):
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(valid)),
+                                     initializer=_init_check_worker,
+                                     initargs=(texts,)) as executor:
+                results = list(executor.map(_find_check_matches, *zip(*valid)))
+        except (OSError, BrokenProcessPool):
+            results = None  # No usable pool here, run the checks in-process
+
+    if results is None:
+        results = [regex_proc.find_in_texts(texts, compiled, ignore_tags=True,
+                                            exclude_pattern=compiled_exclude, indices=indices,
+                                            replacement=replacement)
+                   for compiled, compiled_exclude, indices, replacement in valid]
+
+    results = iter(results)
+    return [(check, compiled, error, None if error is not None else next(results))
+            for check, compiled, _, error in compiled_checks]
+
+
 def tmx_languages_command(args):
     """Return available languages in a TMX file as JSON."""
     parser = TMXParser(args.file)
@@ -50,34 +388,40 @@ def find_command(args):
     print(f"Pattern: {args.pattern}")
     print()
 
-    # Parse XLIFF
+    # Parse XLIFF (read-only: find never saves the file)
     parser = XLIFFParser(args.file)
-    if not parser.parse():
+    if not parser.parse_streaming():
         print("Failed to parse XLIFF file")
         return 1
 
     # Create regex processor
     regex_proc = RegexProcessor()
 
-    # Validate pattern
-    is_valid, error = regex_proc.validate_pattern(args.pattern)
-    if not is_valid:
-        print(f"Invalid regex pattern: {error}")
+    # Loop-invariant options, read from args once
+    exclude = getattr(args, 'exclude', None)
+    search_source = args.source
+    search_target = args.target or not args.source
+    ignore_tags = not args.include_tags
+
+    # Validate and compile pattern
+    flags = 0 if args.case_sensitive else regex_proc.regex_module.IGNORECASE
+    try:
+        compiled, compiled_exclude = _compile_check(regex_proc, args.pattern, flags, exclude)
+    except regex_proc.regex_module.error as e:
+        print(f"Invalid regex pattern: {e}")
         return 1
 
     # Search in translation units
     matches_found = 0
-    flags = 0 if args.case_sensitive else regex_proc.regex_module.IGNORECASE
 
     for tu in parser.get_trans_units():
         # Search in target
-        if args.target or (not args.source and not args.target):
+        if search_target:
             target_text = tu.get_target_text()
             if target_text:
-                exclude = getattr(args, 'exclude', None)
                 matches = regex_proc.find_in_text(
-                    target_text, args.pattern, flags=flags, ignore_tags=not args.include_tags,
-                    exclude_pattern=exclude
+                    target_text, compiled, ignore_tags=ignore_tags,
+                    exclude_pattern=compiled_exclude
                 )
 
                 if matches:
@@ -89,12 +433,11 @@ def find_command(args):
                     print()
 
         # Search in source
-        if args.source:
+        if search_source:
             source_text = tu.get_source_text()
-            exclude = getattr(args, 'exclude', None)
             matches = regex_proc.find_in_text(
-                source_text, args.pattern, flags=flags, ignore_tags=not args.include_tags,
-                exclude_pattern=exclude
+                source_text, compiled, ignore_tags=ignore_tags,
+                exclude_pattern=compiled_exclude
             )
 
             if matches:
@@ -142,17 +485,105 @@ def find_command(args):
     return 0
 
 
+def _iter_batch_find_matches(regex_proc: RegexProcessor, checks, trans_units,
+                             target_texts: List[str], include_texts: bool = True):
+    """
+    Run QA checks over already extracted target texts and yield one
+    batch-find result record per match, in check order.
+
+    Args:
+        regex_proc: Regex processor to compile and run the checks with
+        checks: Enabled checks to run
+        trans_units: Parsed translation units
+        target_texts: Target text of each unit, in the same order
+        include_texts: If False, leave out the unit's source and target text
+            (callers that already have the units can join on tu_id)
+    """
+    # Source texts are only needed for matched units; extract each once
+    source_texts = {}
+
+    for check, compiled, error, matches in _run_checks(regex_proc, checks, target_texts, preview=True):
+        if error is not None:
+            continue  # Skip invalid patterns
+
+        # Checks with a replacement also carry a preview per match
+        for index, start, end, matched, *preview in matches:
+            tu = trans_units[index]
+
+            # The replacement expanded for this match, as replacing would produce it
+            replacement_preview = check.replacement
+            if preview and preview[0] is not None:
+                replacement_preview = preview[0]
+
+            record = {
+                'tu_id': tu.id,
+                'check_name': check.name,
+                'check_order': check.order,
+                'category': check.category,
+                'description': check.description,
+            }
+            if include_texts:
+                source_text = source_texts.get(index)
+                if source_text is None:
+                    source_text = source_texts[index] = tu.get_source_text()
+                record['source'] = source_text
+                record['target'] = target_texts[index]
+            record.update({
+                'match': matched,
+                'match_start': start,
+                'match_end': end,
+                'pattern': check.pattern,
+                'replacement': replacement_preview
+            })
+            yield record
+
+
+def _batch_find_output(regex_proc: RegexProcessor, profile: QAProfile, checks, file_path: str,
+                       trans_units, target_texts: List[str]) -> dict:
+    """
+    Run QA checks and build the batch-find --json document.
+
+    Returns:
+        Dictionary with profile name, file, total_matches and matches
+    """
+    all_results = list(_iter_batch_find_matches(regex_proc, checks, trans_units, target_texts))
+    return {
+        'profile_name': profile.name,
+        'file': file_path,
+        'total_matches': len(all_results),
+        'matches': all_results
+    }
+
+
+def _stream_batch_find(regex_proc: RegexProcessor, profile: QAProfile, checks, file_path: str,
+                       trans_units, target_texts: List[str]) -> None:
+    """
+    Write batch-find results as JSON Lines, without holding them in memory.
+
+    The first line holds profile_name and file, then one line per match
+    (without source/target text, join on tu_id), and a last line with
+    total_matches.
+    """
+    _print_json({'profile_name': profile.name, 'file': file_path})
+    total_matches = 0
+    for record in _iter_batch_find_matches(regex_proc, checks, trans_units, target_texts,
+                                           include_texts=False):
+        _print_json(record)
+        total_matches += 1
+    _print_json({'total_matches': total_matches})
+
+
 def batch_find_command(args):
     """Execute batch find operation using a QA profile."""
-    if args.json:
+    if args.json or args.json_stream:
         # JSON output mode for GUI integration
         try:
             # Load QA profile
             profile = QAProfileManager.load_from_xml(args.profile)
 
-            # Parse XLIFF
+            # Parse XLIFF (read-only: batch-find never saves the file)
             parser = XLIFFParser(args.file)
-            if not parser.parse():
+            if not parser.parse_streaming():
                 print(json.dumps({"error": "Failed to parse XLIFF file"}))
                 return 1
 
@@ -162,70 +593,17 @@ def batch_find_command(args):
             # Get enabled checks from profile
             enabled_checks = QAProfileManager.get_enabled_checks(profile)
 
-            # Collect all matches
-            all_results = []
-
-            for check in enabled_checks:
-                # Validate pattern
-                is_valid, error = regex_proc.validate_pattern(check.pattern)
-                if not is_valid:
-                    continue  # Skip invalid patterns
-
-                flags = 0 if check.case_sensitive else regex_proc.regex_module.IGNORECASE
-
-                for tu in parser.get_trans_units():
-                    # Search in target (default)
-                    target_text = tu.get_target_text()
-                    if target_text:
-                        matches = regex_proc.find_in_text(
-                            target_text,
-                            check.pattern,
-                            flags=flags,
-                            ignore_tags=True,
-                            exclude_pattern=check.exclude_pattern
-                        )
-
-                        for start, end, matched in matches:
-                            # Calculate the actual replacement value for preview
-                            replacement_preview = check.replacement
-                            if check.replacement:
-                                # Convert $1, $2 to \1, \2 for Python regex
-                                import re
-                                converted_replacement = re.sub(r'\$(\d+)', r'\\\1', check.replacement)
-                                # Apply replacement to the matched text to get preview
-                                try:
-                                    replacement_preview = regex_proc.regex_module.sub(
-                                        check.pattern,
-                                        converted_replacement,
-                                        matched,
-                                        flags=flags
-                                    )
-                                except:
-                                    replacement_preview = check.replacement  # Fallback to template
-
-                            all_results.append({
-                                'tu_id': tu.id,
-                                'check_name': check.name,
-                                'check_order': check.order,
-                                'category': check.category,
-                                'description': check.description,
-                                'source': tu.get_source_text(),
-                                'target': target_text,
-                                'match': matched,
-                                'match_start': start,
-                                'match_end': end,
-                                'pattern': check.pattern,
-                                'replacement': replacement_preview
-                            })
-
-            # Output JSON
-            output = {
-                'profile_name': profile.name,
-                'file': args.file,
-                'total_matches': len(all_results),
-                'matches': all_results
-            }
-            print(json.dumps(output, ensure_ascii=False, indent=2))
+            # Extract target texts once per file rather than once per check
+            trans_units = parser.get_trans_units()
+            target_texts = [tu.get_target_text() for tu in trans_units]
+
+            if args.json_stream:
+                _stream_batch_find(regex_proc, profile, enabled_checks, args.file,
+                                   trans_units, target_texts)
+            else:
+                output = _batch_find_output(regex_proc, profile, enabled_checks, args.file,
+                                            trans_units, target_texts)
+                _print_json(output, indent=True, ensure_ascii=False)
 
         except Exception as e:
             print(json.dumps({"error": str(e)}))
@@ -242,9 +620,9 @@ def batch_find_command(args):
         print(f"Description: {profile.description}")
         print()
 
-        # Parse XLIFF
+        # Parse XLIFF (read-only: batch-find never saves the file)
         parser = XLIFFParser(args.file)
-        if not parser.parse():
+        if not parser.parse_streaming():
             print("Failed to parse XLIFF file")
             return 1
 
@@ -257,40 +635,29 @@ def batch_find_command(args):
         print("─" * 60)
         print()
 
+        # Extract target texts once per file rather than once per check
+        trans_units = parser.get_trans_units()
+        target_texts = [tu.get_target_text() for tu in trans_units]
+
         total_matches = 0
 
-        for check in enabled_checks:
+        for check, compiled, error, matches in _run_checks(regex_proc, enabled_checks, target_texts):
             print(f"[{check.order}] {check.name}")
             print(f"    Pattern: {check.pattern}")
             if check.exclude_pattern:
                 print(f"    Exclude: {check.exclude_pattern}")
 
-            # Validate pattern
-            is_valid, error = regex_proc.validate_pattern(check.pattern)
-            if not is_valid:
+            if error is not None:
                 print(f"    ✗ Invalid pattern: {error}")
                 print()
                 continue
 
-            flags = 0 if check.case_sensitive else regex_proc.regex_module.IGNORECASE
             check_matches = 0
 
-            for tu in parser.get_trans_units():
-                target_text = tu.get_target_text()
-                if target_text:
-                    matches = regex_proc.find_in_text(
-                        target_text,
-                        check.pattern,
-                        flags=flags,
-                        ignore_tags=True,
-                        exclude_pattern=check.exclude_pattern
-                    )
-
-                    if matches:
-                        for start, end, matched in matches:
-                            print(f"    [TU {tu.id}] '{matched}' (pos {start}-{end})")
-                            check_matches += 1
-                            total_matches += 1
+            for index, start, end, matched in matches:
+                print(f"    [TU {trans_units[index].id}] '{matched}' (pos {start}-{end})")
+                check_matches += 1
+                total_matches += 1
 
             if check_matches > 0:
                 print(f"    ✓ Found {check_matches} match(es)")
@@ -304,6 +671,82 @@ def batch_find_command(args):
     return 0
 
 
+def _batch_replace_units(regex_proc: RegexProcessor, checks, trans_units,
+                         target_texts: List[str], log=print):
+    """
+    Apply QA check replacements to translation units in check order.
+
+    Each check sees the targets as left by the previous checks; target_texts
+    is kept in sync with every modified unit.
+
+    Args:
+        regex_proc: Regex processor to compile and run the checks with
+        checks: Enabled checks that have a replacement
+        trans_units: Parsed translation units
+        target_texts: Target text of each unit, in the same order
+        log: Callable used for progress output
+
+    Returns:
+        Tuple of (total_replacements, set of modified unit IDs)
+    """
+    total_replacements = 0
+
+    # Track which TUs were modified to avoid duplicate modifications
+    modified_tus = set()
+
+    for check in checks:
+        log(f"[{check.order}] {check.name}")
+        log(f"    Pattern: {check.pattern}")
+        log(f"    Replacement: {check.replacement}")
+        if check.exclude_pattern:
+            log(f"    Exclude: {check.exclude_pattern}")
+
+        # Validate and compile pattern once for all trans-units
+        flags = 0 if check.case_sensitive else regex_proc.regex_module.IGNORECASE
+        try:
+            compiled, compiled_exclude = _compile_check(
+                regex_proc, check.pattern, flags, check.exclude_pattern)
+        except regex_proc.regex_module.error as e:
+            log(f"    ✗ Invalid pattern: {e}")
+            log()
+            continue
+
+        check_replacements = 0
+        check_units = 0
+
+        for index, tu in enumerate(trans_units):
+            target_text = target_texts[index]
+            if target_text:
+                new_text, count = regex_proc.replace_in_text(
+                    target_text,
+                    compiled,
+                    check.replacement,
+                    ignore_tags=True,
+                    exclude_pattern=compiled_exclude
+                )
+
+                if count > 0:
+                    log(f"    [TU {tu.id}] {count} replacement(s)")
+                    log(f"      Before: {target_text[:60]}...")
+                    log(f"      After:  {new_text[:60]}...")
+
+                    tu.set_target_text(new_text)
+                    # Re-read, as set_target_text may normalize the markup
+                    target_texts[index] = tu.get_target_text()
+                    check_replacements += count
+                    check_units += 1
+                    modified_tus.add(tu.id)
+
+        if check_replacements > 0:
+            log(f"    ✓ {check_replacements} replacement(s) in {check_units} unit(s)")
+            total_replacements += check_replacements
+        else:
+            log(f"    ○ No replacements")
+        log()
+
+    return total_replacements, modified_tus
+
+
 def batch_replace_command(args):
     """Execute batch replace operation using a QA profile."""
     print(f"Running batch replacements on: {args.file}")
@@ -340,59 +783,12 @@ def batch_replace_command(args):
     print("─" * 60)
     print()
 
-    total_replacements = 0
-    total_units_modified = 0
-
-    # Track which TUs were modified to avoid duplicate modifications
-    modified_tus = set()
-
-    for check in enabled_checks:
-        print(f"[{check.order}] {check.name}")
-        print(f"    Pattern: {check.pattern}")
-        print(f"    Replacement: {check.replacement}")
-        if check.exclude_pattern:
-            print(f"    Exclude: {check.exclude_pattern}")
-
-        # Validate pattern
-        is_valid, error = regex_proc.validate_pattern(check.pattern)
-        if not is_valid:
-            print(f"    ✗ Invalid pattern: {error}")
-            print()
-            continue
-
-        flags = 0 if check.case_sensitive else regex_proc.regex_module.IGNORECASE
-        check_replacements = 0
-        check_units = 0
-
-        for tu in parser.get_trans_units():
-            target_text = tu.get_target_text()
-            if target_text:
-                new_text, count = regex_proc.replace_in_text(
-                    target_text,
-                    check.pattern,
-                    check.replacement,
-                    flags=flags,
-                    ignore_tags=True,
-                    exclude_pattern=check.exclude_pattern
-                )
-
-                if count > 0:
-                    print(f"    [TU {tu.id}] {count} replacement(s)")
-                    print(f"      Before: {target_text[:60]}...")
-                    print(f"      After:  {new_text[:60]}...")
-
-                    tu.set_target_text(new_text)
-                    check_replacements += count
-                    check_units += 1
-                    modified_tus.add(tu.id)
-
-        if check_replacements > 0:
-            print(f"    ✓ {check_replacements} replacement(s) in {check_units} unit(s)")
-            total_replacements += check_replacements
-        else:
-            print(f"    ○ No replacements")
-        print()
+    # Extract target texts once; re-read only the units a check modifies
+    trans_units = parser.get_trans_units()
+    target_texts = [tu.get_target_text() for tu in trans_units]
 
+    total_replacements, modified_tus = _batch_replace_units(
+        regex_proc, enabled_checks, trans_units, target_texts)
     total_units_modified = len(modified_tus)
 
     # Save modified file
@@ -418,7 +814,107 @@ def batch_replace_command(args):
             'total_replacements': total_replacements,
             'output_path': args.output if args.output else args.file
         }
-        print(json.dumps(result))
+        _print_json(result)
+
+    return 0
+
+
+def _load_batch_file(file_path: str):
+    """
+    Parse an XLIFF file and extract its target texts for batch-daemon.
+
+    Returns:
+        Tuple of (parser, trans_units, target_texts, file_signature),
+        or None if parsing failed
+    """
+    parser = XLIFFParser(file_path)
+    if not parser.parse():
+        return None
+    trans_units = parser.get_trans_units()
+    target_texts = [tu.get_target_text() for tu in trans_units]
+    return parser, trans_units, target_texts, _file_signature(file_path)
+
+
+def _file_signature(file_path: str):
+    """Return (mtime_ns, size) used to notice when a file changed on disk."""
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size
+
+
+def batch_daemon_command(args):
+    """
+    Serve batch-find/batch-replace requests for one XLIFF file over stdin.
+
+    The file is parsed once and only re-parsed when it changes on disk, so
+    repeated previews skip the parse. Each stdin line is a JSON request and
+    gets exactly one JSON line back on stdout:
+
+        {"op": "find", "profile": "qa.xml"}
+        {"op": "replace", "profile": "qa.xml", "output": null, "backup": true}
+        {"op": "quit"}
+
+    Progress messages go to stderr so stdout only carries responses.
+    """
+    regex_proc = RegexProcessor()
+    loaded = None
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            op = request.get('op')
+            if op == 'quit':
+                break
+
+            with contextlib.redirect_stdout(sys.stderr):
+                if loaded is None or loaded[3] != _file_signature(args.file):
+                    loaded = _load_batch_file(args.file)
+                if loaded is None:
+                    response = {"error": "Failed to parse XLIFF file"}
+                else:
+                    parser, trans_units, target_texts, _ = loaded
+                    profile = QAProfileManager.load_from_xml(request['profile'])
+                    enabled_checks = QAProfileManager.get_enabled_checks(profile)
+
+                    if op == 'find':
+                        response = _batch_find_output(regex_proc, profile, enabled_checks,
+                                                      args.file, trans_units, target_texts)
+                    elif op == 'replace':
+                        output_path = request.get('output') or args.file
+                        if request.get('backup', True):
+                            BackupManager().create_backup(args.file)
+
+                        checks = [c for c in enabled_checks if c.replacement]
+                        total_replacements, modified_tus = _batch_replace_units(
+                            regex_proc, checks, trans_units, target_texts,
+                            log=lambda *a: None)
+
+                        saved = total_replacements > 0 and parser.save(output_path)
+                        if total_replacements > 0:
+                            # The parsed tree now differs from args.file or was
+                            # rewritten by save(); parse it again next time
+                            loaded = None
+
+                        if total_replacements > 0 and not saved:
+                            response = {"error": "Failed to save file"}
+                        else:
+                            response = {
+                                'success': total_replacements > 0,
+                                'modified_units': len(modified_tus),
+                                'total_replacements': total_replacements,
+                                'output_path': output_path
+                            }
+                    else:
+                        response = {"error": f"Unknown op: {op}"}
+
+        except Exception as e:
+            response = {"error": str(e)}
+
+        _print_json(response)
+        sys.stdout.flush()
 
     return 0
 
@@ -448,32 +944,39 @@ def replace_command(args):
     # Create regex processor
     regex_proc = RegexProcessor()
 
-    # Validate pattern
-    is_valid, error = regex_proc.validate_pattern(args.pattern)
-    if not is_valid:
-        print(f"Invalid regex pattern: {error}")
+    # Loop-invariant options, read from args once
+    exclude = getattr(args, 'exclude', None)
+    replace_source = args.source
+    replace_target = args.target or not args.source
+    ignore_tags = not args.include_tags
+    replacement = args.replacement
+    max_replacements = args.max_replacements if args.max_replacements > 0 else 0
+
+    # Validate and compile pattern (library patterns arrive precompiled)
+    flags = 0 if args.case_sensitive else regex_proc.regex_module.IGNORECASE
+    try:
+        compiled, compiled_exclude = _compile_check(
+            regex_proc, getattr(args, 'compiled', None) or args.pattern, flags, exclude)
+    except regex_proc.regex_module.error as e:
+        print(f"Invalid regex pattern: {e}")
         return 1
 
     # Replace in translation units
     total_replacements = 0
     modified_units = 0
-    flags = 0 if args.case_sensitive else regex_proc.regex_module.IGNORECASE
 
-    for tu in parser.get_trans_units():
+    trans_units = parser.get_trans_units()
+    target_texts = [tu.get_target_text() for tu in trans_units] if replace_target else []
+    results = _replace_in_texts(regex_proc, target_texts, compiled, replacement,
+                                ignore_tags=ignore_tags, max_replacements=max_replacements,
+                                exclude_pattern=compiled_exclude)
+
+    for index, tu in enumerate(trans_units):
         # Replace in target (default)
-        if args.target or (not args.source and not args.target):
-            target_text = tu.get_target_text()
+        if replace_target:
+            target_text = target_texts[index]
             if target_text:
-                exclude = getattr(args, 'exclude', None)
-                new_text, count = regex_proc.replace_in_text(
-                    target_text,
-                    args.pattern,
-                    args.replacement,
-                    flags=flags,
-                    ignore_tags=not args.include_tags,
-                    max_replacements=args.max_replacements if args.max_replacements > 0 else 0,
-                    exclude_pattern=exclude
-                )
+                new_text, count = results[index]
 
                 if count > 0:
                     print(f"[TU: {tu.id}] TARGET:")
@@ -486,7 +989,7 @@ def replace_command(args):
                     modified_units += 1
 
         # Replace in source (if requested)
-        if args.source:
+        if replace_source:
             print("Warning: Replacing in source segments is not recommended")
             # Implementation would go here if needed
 
@@ -541,189 +1044,162 @@ def replace_command(args):
     return 0
 
 
+def _is_structural_source(source_text: str) -> bool:
+    """
+    Check if a source is empty or only inline tags (like <x id="4"/>).
+    Such structural segments are common in SDLXLIFF files.
+    """
+    source = source_text.strip()
+    return source in ('', '<x/>', '<g/>') or (source.startswith('<x ') and source.endswith('/>'))
+
+
+def _stats_unit(tu, source_text: str) -> dict:
+    """Build the stats --json entry for one translation unit."""
+    # Extract metadata from trans-unit element
+    metadata = {}
+
+    # Common XLIFF metadata attributes
+    if tu.element is not None:
+        # lxml builds a new attrib proxy on every access, so fetch it once
+        attrib = tu.element.attrib
+
+        # Match quality/percentage from different CAT tools
+        if 'percent' in attrib:
+            metadata['match_percent'] = attrib['percent']
+        if 'match-quality' in attrib:
+            metadata['match_quality'] = attrib['match-quality']
+
+        # Locked/approved status
+        if 'translate' in attrib:
+            metadata['translate'] = attrib['translate']
+        if 'approved' in attrib:
+            metadata['approved'] = attrib['approved']
+
+        # MemoQ and Phrase specific metadata in one pass over the
+        # attributes. Phrase values take precedence over MemoQ ones.
+        memoq_metadata = {}
+        phrase_metadata = {}
+        for attr_name, attr_value in attrib.items():
+            memoq_rule, phrase_rule = _classify_metadata_attr(attr_name)
+
+            # MemoQ rules skip empty values
+            if memoq_rule and attr_value and attr_value.strip():
+                key, convert = memoq_rule
+                value = convert(attr_value) if convert else attr_value
+                if value is not None:
+                    memoq_metadata[key] = value
+
+            if phrase_rule:
+                key, convert = phrase_rule
+                phrase_metadata[key] = convert(attr_value) if convert else attr_value
+
+        metadata.update(memoq_metadata)
+        metadata.update(phrase_metadata)
+
+        # Modified date/user - check target element (standard XLIFF)
+        if tu.target is not None:
+            target_attrib = tu.target.attrib
+            if 'changedate' in target_attrib:
+                metadata['modified_date'] = target_attrib['changedate']
+            if 'changeid' in target_attrib:
+                metadata['modified_by'] = target_attrib['changeid']
+            if 'state' in target_attrib:
+                metadata['state'] = target_attrib['state']
+
+        # SDLXLIFF specific metadata from <sdl:seg-defs>
+        # Look for sdl:seg-defs element
+        seg_defs = tu.element.find('.//sdl:seg-defs', namespaces=_SDL_NS)
+        if seg_defs is not None:
+            # Find first sdl:seg element
+            seg = seg_defs.find('sdl:seg', namespaces=_SDL_NS)
+            if seg is not None:
+                # Extract percent, conf (state), origin
+                seg_attrib = seg.attrib
+                if 'percent' in seg_attrib:
+                    metadata['match_percent'] = seg_attrib['percent']
+                if 'conf' in seg_attrib:
+                    metadata['state'] = seg_attrib['conf']
+                if 'origin' in seg_attrib:
+                    metadata['origin'] = seg_attrib['origin']
+                if 'origin-system' in seg_attrib:
+                    origin_system = seg_attrib['origin-system']
+                    if origin_system:
+                        if 'origin' in metadata:
+                            metadata['origin'] = f"{metadata['origin']} ({origin_system})"
+                        else:
+                            metadata['origin'] = origin_system
+
+    # ICU validation
+    target_text = tu.get_target_text()
+    icu_errors = None
+
+    if ICUValidator.has_icu_syntax(source_text) or ICUValidator.has_icu_syntax(target_text):
+        errors = ICUValidator.validate_segment(source_text, target_text)
+        if errors:
+            icu_errors = errors
+
+    return {
+        "id": tu.id,
+        "source": source_text,
+        "target": target_text,
+        "metadata": metadata if metadata else None,
+        "icu_errors": icu_errors,
+        "tms_metadata": tu.tms_metadata
+    }
+
+
 def stats_command(args):
     """Show statistics about XLIFF/TMX file."""
-    import json
-
     target_lang = getattr(args, 'target_lang', None)
     parser = get_parser(args.file, target_lang)
-    if not parser.parse():
+    # stats never saves, so XLIFF files can be streamed read-only
+    parsed = parser.parse_streaming() if isinstance(parser, XLIFFParser) else parser.parse()
+    if not parsed:
         if args.json:
             print(json.dumps({"error": "Failed to parse XLIFF file"}))
         else:
             print("Failed to parse XLIFF file")
         return 1
 
-    stats = parser.get_statistics()
-
     if args.json:
         # Output JSON for GUI integration
-        trans_units = []
-        for tu in parser.get_trans_units():
-            # Extract metadata from trans-unit element
-            metadata = {}
-
-            # Common XLIFF metadata attributes
-            if tu.element is not None:
-                # Match quality/percentage from different CAT tools
-                if 'percent' in tu.element.attrib:
-                    metadata['match_percent'] = tu.element.get('percent')
-                if 'match-quality' in tu.element.attrib:
-                    metadata['match_quality'] = tu.element.get('match-quality')
-
-                # Locked/approved status
-                if 'translate' in tu.element.attrib:
-                    metadata['translate'] = tu.element.get('translate')
-                if 'approved' in tu.element.attrib:
-                    metadata['approved'] = tu.element.get('approved')
-
-                # MemoQ MQXLIFF specific metadata (mq: namespace)
-                # Check for mq: namespace attributes
-                for attr_name, attr_value in tu.element.attrib.items():
-                    # Skip empty values
-                    if not attr_value or attr_value.strip() == '':
-                        continue
-
-                    # MemoQ status
-                    if 'status' in attr_name.lower() and 'mq' in attr_name.lower():
-                        metadata['state'] = attr_value
-                    # MemoQ match percent
-                    elif 'percent' in attr_name.lower() and 'mq' in attr_name.lower():
-                        metadata['match_percent'] = attr_value
-                    # MemoQ last changing user
-                    elif 'lastchanginguser' in attr_name.lower():
-                        metadata['modified_by'] = attr_value
-                    # MemoQ last changed timestamp
-                    elif 'lastchangedtimestamp' in attr_name.lower():
-                        # Only set if it's a valid timestamp (not 0001-01-01)
-                        if not attr_value.startswith('0001'):
-                            metadata['modified_date'] = attr_value.replace('T', ' ').replace('Z', '')
-                    # MemoQ translator commit username
-                    elif 'translatorcommitusername' in attr_name.lower():
-                        metadata['created_by'] = attr_value
-                    # MemoQ translator commit timestamp
-                    elif 'translatorcommittimestamp' in attr_name.lower():
-                        # Only set if it's a valid timestamp (not 0001-01-01)
-                        if not attr_value.startswith('0001'):
-                            metadata['created_date'] = attr_value.replace('T', ' ').replace('Z', '')
-
-                # Phrase MXLIFF specific metadata (m: namespace)
-                # Extract attributes with {Memsource} or {m:} namespace prefix
-                for attr_name, attr_value in tu.element.attrib.items():
-                    # Handle Phrase/Memsource custom attributes
-                    if 'confirmed' in attr_name.lower():
-                        metadata['approved'] = 'yes' if attr_value == '1' else 'no'
-                    elif 'score' in attr_name.lower() and 'gross' not in attr_name.lower():
-                        metadata['match_percent'] = str(int(float(attr_value) * 100))
-                    elif 'locked' in attr_name.lower():
-                        metadata['locked'] = 'yes' if attr_value.lower() == 'true' or attr_value == '1' else 'no'
-                    elif 'modified-at' in attr_name.lower():
-                        # Convert timestamp to readable format
-                        from datetime import datetime
-                        try:
-                            timestamp = int(attr_value) / 1000  # Convert from milliseconds
-                            dt = datetime.fromtimestamp(timestamp)
-                            metadata['modified_date'] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            metadata['modified_date'] = attr_value
-                    elif 'modified-by' in attr_name.lower():
-                        metadata['modified_by'] = attr_value
-                    elif 'created-at' in attr_name.lower():
-                        from datetime import datetime
-                        try:
-                            timestamp = int(attr_value) / 1000
-                            dt = datetime.fromtimestamp(timestamp)
-                            metadata['created_date'] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            metadata['created_date'] = attr_value
-                    elif 'created-by' in attr_name.lower():
-                        metadata['created_by'] = attr_value
-                    elif 'trans-origin' in attr_name.lower():
-                        metadata['origin'] = attr_value
-
-                # Modified date/user - check target element (standard XLIFF)
-                if tu.target is not None:
-                    if 'changedate' in tu.target.attrib:
-                        metadata['modified_date'] = tu.target.get('changedate')
-                    if 'changeid' in tu.target.attrib:
-                        metadata['modified_by'] = tu.target.get('changeid')
-                    if 'state' in tu.target.attrib:
-                        metadata['state'] = tu.target.get('state')
-
-                # SDLXLIFF specific metadata from <sdl:seg-defs>
-                # Look for sdl:seg-defs element
-                sdl_ns = {'sdl': 'http://sdl.com/FileTypes/SdlXliff/1.0'}
-                seg_defs = tu.element.find('.//sdl:seg-defs', namespaces=sdl_ns)
-                if seg_defs is not None:
-                    # Find first sdl:seg element
-                    seg = seg_defs.find('sdl:seg', namespaces=sdl_ns)
-                    if seg is not None:
-                        # Extract percent, conf (state), origin
-                        if 'percent' in seg.attrib:
-                            metadata['match_percent'] = seg.get('percent')
-                        if 'conf' in seg.attrib:
-                            metadata['state'] = seg.get('conf')
-                        if 'origin' in seg.attrib:
-                            metadata['origin'] = seg.get('origin')
-                        if 'origin-system' in seg.attrib:
-                            origin_system = seg.get('origin-system')
-                            if origin_system:
-                                if 'origin' in metadata:
-                                    metadata['origin'] = f"{metadata['origin']} ({origin_system})"
-                                else:
-                                    metadata['origin'] = origin_system
-
-            # ICU validation
-            source_text = tu.get_source_text()
-            target_text = tu.get_target_text()
-            icu_errors = None
-
-            if ICUValidator.has_icu_syntax(source_text) or ICUValidator.has_icu_syntax(target_text):
-                errors = ICUValidator.validate_segment(source_text, target_text)
-                if errors:
-                    icu_errors = errors
-
-            trans_units.append({
-                "id": tu.id,
-                "source": source_text,
-                "target": target_text,
-                "metadata": metadata if metadata else None,
-                "icu_errors": icu_errors,
-                "tms_metadata": tu.tms_metadata
-            })
-
-        # Filter out empty/structural segments (only tags, no text content)
-        # These are common in SDLXLIFF files
-        filtered_units = []
-        for unit in trans_units:
-            # Check if source has actual text (not just tags like <x id="4"/>)
-            source = unit['source']
-            # Skip if source is empty or only contains inline tags
-            if source and not (source.strip().startswith('<x ') and source.strip().endswith('/>')) and source.strip() not in ['', '<x/>', '<g/>']:
-                filtered_units.append(unit)
-
-        # Use filtered units if they exist, otherwise use all
-        display_units = filtered_units if filtered_units else trans_units
-
-        # Add sequential segment numbers (1, 2, 3...) for display
-        # Keep original ID intact so save/apply-edits can match correctly
-        for idx, unit in enumerate(display_units, start=1):
-            unit['segment_number'] = idx
-
-        # Recalculate stats based on filtered display_units
+        # Empty/structural segments (only tags, no text content) are skipped
+        # before any metadata is extracted. Files with nothing else get a
+        # second pass that shows all units instead.
+        display_units = []
+        translated = 0
+        for skip_structural in (True, False):
+            for tu in parser.get_trans_units():
+                source_text = tu.get_source_text()
+                if skip_structural and _is_structural_source(source_text):
+                    continue
+
+                # Add sequential segment numbers (1, 2, 3...) for display
+                # Keep original ID intact so save/apply-edits can match correctly
+                unit = _stats_unit(tu, source_text)
+                display_units.append(unit)
+                unit['segment_number'] = len(display_units)
+                if unit['target'] and unit['target'].strip():
+                    translated += 1
+
+            if display_units:
+                break
+
+        # Stats based on filtered display_units
         filtered_stats = {
             'total_units': len(display_units),
-            'translated': sum(1 for u in display_units if u['target'] and u['target'].strip()),
-            'untranslated': sum(1 for u in display_units if not u['target'] or not u['target'].strip())
+            'translated': translated,
+            'untranslated': len(display_units) - translated
         }
 
         output = {
             "trans_units": display_units,
             "stats": filtered_stats
         }
-        print(json.dumps(output))
+        _print_json(output)
     else:
         # Human-readable output
+        stats = parser.get_statistics()
         print(f"XLIFF Statistics for: {args.file}")
         print(f"{'─' * 50}")
         print(f"Total translation units: {stats['total_units']}")
@@ -783,7 +1259,8 @@ def backup_command(args):
             print(f"Backups for {args.file}:")
             for backup in backups:
                 info = backup_mgr.get_backup_info(backup)
-                print(f"  - {info['name']} ({info['size']} bytes, {info['modified']})")
+                if info:
+                    print(f"  - {info.name} ({info.size} bytes, {info.modified})")
         else:
             print("No backups found")
 
@@ -806,10 +1283,32 @@ def backup_command(args):
     return 0
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_pattern_library(library_path: str, signature) -> PatternLibrary:
+    """Load the pattern library; reused while the file signature is unchanged."""
+    library = PatternLibrary(library_path)
+    library.load_custom_patterns()
+    return library
+
+
+def _load_pattern_library() -> PatternLibrary:
+    """
+    Get the pattern library with custom patterns loaded.
+
+    The custom patterns file is only re-read and re-parsed when its
+    (mtime, size) changed since the last call in this process.
+    """
+    library_path = str(PatternLibrary.default_library_path())
+    try:
+        signature = _file_signature(library_path)
+    except OSError:
+        signature = None  # No custom patterns saved yet
+    return _cached_pattern_library(library_path, signature)
+
+
 def patterns_command(args):
     """Manage pattern library."""
-    library = PatternLibrary()
-    library.load_custom_patterns()
+    library = _load_pattern_library()
 
     if args.action == 'list':
         # List patterns with optional filtering
@@ -825,36 +1324,40 @@ def patterns_command(args):
 
         # Group by category if not filtering by category
         if not args.category:
-            categories = {}
+            categories = defaultdict(list)
             for pattern in patterns:
-                if pattern.category not in categories:
-                    categories[pattern.category] = []
                 categories[pattern.category].append(pattern)
 
+            # Collect the listing and write it in one go rather than one
+            # print() per line
+            lines = []
             for category in sorted(categories.keys()):
-                print(f"\n{category}:")
-                print("─" * 60)
+                lines.append(f"\n{category}:")
+                lines.append("─" * 60)
                 for pattern in categories[category]:
                     status = "✓" if pattern.enabled else "○"
-                    print(f"  [{status}] {pattern.name}")
-                    print(f"      Pattern: {pattern.pattern}")
+                    lines.append(f"  [{status}] {pattern.name}")
+                    lines.append(f"      Pattern: {pattern.pattern}")
                     if pattern.replacement:
-                        print(f"      Replacement: {pattern.replacement}")
+                        lines.append(f"      Replacement: {pattern.replacement}")
                     if pattern.description:
-                        print(f"      {pattern.description}")
+                        lines.append(f"      {pattern.description}")
                     if pattern.tags:
-                        print(f"      Tags: {', '.join(pattern.tags)}")
-                    print()
+                        lines.append(f"      Tags: {', '.join(pattern.tags)}")
+                    lines.append("")
+            print("\n".join(lines))
         else:
+            lines = []
             for pattern in patterns:
                 status = "✓" if pattern.enabled else "○"
-                print(f"[{status}] {pattern.name}")
-                print(f"    Pattern: {pattern.pattern}")
+                lines.append(f"[{status}] {pattern.name}")
+                lines.append(f"    Pattern: {pattern.pattern}")
                 if pattern.replacement:
-                    print(f"    Replacement: {pattern.replacement}")
+                    lines.append(f"    Replacement: {pattern.replacement}")
                 if pattern.description:
-                    print(f"    {pattern.description}")
-                print()
+                    lines.append(f"    {pattern.description}")
+                lines.append("")
+            print("\n".join(lines))
 
     elif args.action == 'search':
         if not args.query:
@@ -867,14 +1370,15 @@ def patterns_command(args):
             print(f"No patterns found matching '{args.query}'")
             return 0
 
-        print(f"Found {len(results)} patterns matching '{args.query}':\n")
+        lines = [f"Found {len(results)} patterns matching '{args.query}':\n"]
         for pattern in results:
             status = "✓" if pattern.enabled else "○"
-            print(f"[{status}] {pattern.name} ({pattern.category})")
-            print(f"    Pattern: {pattern.pattern}")
+            lines.append(f"[{status}] {pattern.name} ({pattern.category})")
+            lines.append(f"    Pattern: {pattern.pattern}")
             if pattern.replacement:
-                print(f"    Replacement: {pattern.replacement}")
-            print()
+                lines.append(f"    Replacement: {pattern.replacement}")
+            lines.append("")
+        print("\n".join(lines))
 
     elif args.action == 'show':
         if not args.name:
@@ -937,21 +1441,25 @@ def patterns_command(args):
             print(f"Replacement: {pattern.replacement}")
         print()
 
-        # Create a mock args object for replace_command
-        class ReplaceArgs:
-            def __init__(self):
-                self.file = args.file
-                self.pattern = pattern.pattern
-                self.replacement = pattern.replacement
-                self.output = args.output
-                self.source = False
-                self.target = True
-                self.case_sensitive = pattern.case_sensitive
-                self.include_tags = False
-                self.no_backup = args.no_backup
-                self.max_replacements = 0
-
-        return replace_command(ReplaceArgs())
+        try:
+            compiled = pattern.compiled()
+        except Exception:
+            compiled = None  # replace_command reports the invalid pattern
+
+        # Build the args object replace_command expects
+        return replace_command(SimpleNamespace(
+            file=args.file,
+            pattern=pattern.pattern,
+            compiled=compiled,
+            replacement=pattern.replacement,
+            output=args.output,
+            source=False,
+            target=True,
+            case_sensitive=pattern.case_sensitive,
+            include_tags=False,
+            no_backup=args.no_backup,
+            max_replacements=0
+        ))
 
     elif args.action == 'add':
         # Add custom pattern
@@ -970,6 +1478,10 @@ def patterns_command(args):
             tags=args.tag or []
         )
 
+        # The cached library is modified in place below, so make the next
+        # call load it from disk again, even if saving fails
+        _cached_pattern_library.cache_clear()
+
         if library.add_pattern(new_pattern):
             if library.save_custom_patterns():
                 print(f"Pattern '{args.name}' added successfully")
@@ -985,6 +1497,10 @@ def patterns_command(args):
             print("Error: --name required for remove")
             return 1
 
+        # The cached library is modified in place below, so make the next
+        # call load it from disk again, even if saving fails
+        _cached_pattern_library.cache_clear()
+
         if library.remove_pattern(args.name):
             if library.save_custom_patterns():
                 print(f"Pattern '{args.name}' removed")
@@ -998,18 +1514,26 @@ def patterns_command(args):
     return 0
 
 
-def apply_edits_command(args):
-    """Apply edits from JSON file to XLIFF or TMX."""
-    import json
+def _iter_edits(edits_json: str):
+    """
+    Yield (id, target) pairs from an apply-edits JSON array.
 
-    # Read edits from JSON file
-    try:
-        with open(args.edits_json, 'r', encoding='utf-8') as f:
+    With ijson the array is decoded one record at a time, so the edits are
+    never held in memory together; otherwise the whole file is loaded.
+    """
+    if ijson is not None:
+        with open(edits_json, 'rb') as f:
+            for edit in ijson.items(f, 'item'):
+                yield edit['id'], edit['target']
+    else:
+        with open(edits_json, 'r', encoding='utf-8') as f:
             edits = json.load(f)
-    except Exception as e:
-        print(f"Failed to read edits JSON: {e}")
-        return 1
+        for edit in edits:
+            yield edit['id'], edit['target']
+
 
+def apply_edits_command(args):
+    """Apply edits from JSON file to XLIFF or TMX."""
     # Parse file (XLIFF or TMX)
     target_lang = getattr(args, 'target_lang', None)
     parser = get_parser(args.file, target_lang)
@@ -1017,23 +1541,42 @@ def apply_edits_command(args):
         print("Failed to parse file")
         return 1
 
-    # Create backup
-    backup_mgr = BackupManager()
-    backup_path = backup_mgr.create_backup(args.file)
-    if backup_path:
-        print(f"Backup created: {backup_path}")
-
     # Apply edits
-    edits_dict = {edit['id']: edit['target'] for edit in edits}
-
     try:
+        # Index trans-units by ID once so each edit is a lookup instead of a
+        # scan over the whole file. IDs are not guaranteed unique, so every
+        # unit sharing an ID still gets the edit.
+        tus_by_id = {}
         for tu in parser.get_trans_units():
-            if tu.id in edits_dict:
-                tu.set_target_text(edits_dict[tu.id])
+            tus_by_id.setdefault(tu.id, []).append(tu)
+
+        # Apply each edit as it is read; only the edited IDs are kept, for
+        # the count. A later edit of the same ID wins, as before.
+        edited_ids = set()
+        edits = _iter_edits(args.edits_json)
+        while True:
+            try:
+                tu_id, target = next(edits)
+            except StopIteration:
+                break
+            except Exception as e:
+                # Nothing has been written yet: the file is only saved below
+                print(f"Failed to read edits JSON: {e}")
+                return 1
+
+            edited_ids.add(tu_id)
+            for tu in tus_by_id.get(tu_id, ()):
+                tu.set_target_text(target)
+
+        # Create backup
+        backup_mgr = BackupManager()
+        backup_path = backup_mgr.create_backup(args.file)
+        if backup_path:
+            print(f"Backup created: {backup_path}")
 
         # Save modified XLIFF
         if parser.save(args.file):
-            print(f"Successfully saved {len(edits_dict)} edits to {args.file}")
+            print(f"Successfully saved {len(edited_ids)} edits to {args.file}")
             return 0
         else:
             print("Failed to save XLIFF file")
@@ -1043,8 +1586,9 @@ def apply_edits_command(args):
         return 1
 
 
-def main():
-    """Main entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once per process."""
     parser = argparse.ArgumentParser(
         description='XLIFF Regex Tool - Find & Replace with regex in XLIFF files'
     )
@@ -1068,6 +1612,7 @@ def main():
     batch_find_parser.add_argument('file', help='XLIFF file path')
     batch_find_parser.add_argument('profile', help='QA profile XML file path')
     batch_find_parser.add_argument('--json', action='store_true', help='Output as JSON (for GUI integration)')
+    batch_find_parser.add_argument('--json-stream', action='store_true', help='Output as JSON Lines, one match per line')
     batch_find_parser.set_defaults(func=batch_find_command)
 
     # Batch replace command
@@ -1079,6 +1624,11 @@ def main():
     batch_replace_parser.add_argument('--json', action='store_true', help='Output as JSON (for GUI integration)')
     batch_replace_parser.set_defaults(func=batch_replace_command)
 
+    # Batch daemon command
+    batch_daemon_parser = subparsers.add_parser('batch-daemon', help='Serve batch find/replace requests for one file over stdin (JSON lines)')
+    batch_daemon_parser.add_argument('file', help='XLIFF file path')
+    batch_daemon_parser.set_defaults(func=batch_daemon_command)
+
     # Replace command
     replace_parser = subparsers.add_parser('replace', help='Replace pattern in XLIFF file')
     replace_parser.add_argument('file', help='XLIFF file path')
@@ -1151,6 +1701,12 @@ def main():
     patterns_parser.add_argument('--no-backup', action='store_true', help='Skip backup (for apply)')
     patterns_parser.set_defaults(func=patterns_command)
 
+    return parser
+
+
+def main():
+    """Main entry point."""
+    parser = _build_arg_parser()
     args = parser.parse_args()
 
     if not args.command:
@@ -1161,4 +1717,5 @@ def main():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # Needed for the pool in PyInstaller builds
     sys.exit(main())
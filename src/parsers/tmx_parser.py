@@ -184,10 +184,12 @@ class TMXParser:
 
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about the TMX file."""
+        total = len(self.trans_units)
+        translated = sum(1 for tu in self.trans_units if tu.target is not None)
         return {
-            'total_units': len(self.trans_units),
-            'translated': sum(1 for tu in self.trans_units if tu.target is not None),
-            'untranslated': sum(1 for tu in self.trans_units if tu.target is None)
+            'total_units': total,
+            'translated': translated,
+            'untranslated': total - translated
         }
 
     def get_available_languages(self) -> List[str]:
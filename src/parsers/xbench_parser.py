@@ -4,12 +4,27 @@ Extracts regex patterns from Xbench checklist files for use in XLIFF processing.
 """
 
 from lxml import etree
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+# Candidate child tags (or attributes) for each item field, in priority order
+_NAME_TAGS = ('Name', 'Description', 'Text')
+_SEARCH_TAGS = ('SearchText', 'Search', 'Pattern', 'FindText', 'SourceText')
+_REPLACE_TAGS = ('ReplaceText', 'Replace', 'Replacement', 'TargetText')
+_REGEX_TAGS = ('IsRegEx', 'IsRegex', 'RegEx', 'UseRegex', 'RegularExpression')
+_CASE_TAGS = ('CaseSensitive', 'MatchCase', 'CaseMatching')
+_SOURCE_TAGS = ('SearchInSource', 'CheckSource', 'Source')
+_TARGET_TAGS = ('SearchInTarget', 'CheckTarget', 'Target')
+_ENABLED_TAGS = ('Enabled', 'Active', 'IsEnabled')
+_CATEGORY_TAGS = ('Category', 'Group', 'Type')
+_DESCRIPTION_TAGS = ('Description', 'Comment', 'Notes', 'Help')
+
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+
+
+@dataclass(slots=True)
 class ChecklistItem:
     """Represents a single checklist item from Xbench."""
     id: str
@@ -33,114 +48,116 @@ class XbenchParser:
     including regex patterns that can be reused for find/replace operations.
     """
 
+    # Xbench uses different element names depending on the check type
+    ITEM_TAGS = ('ChecklistItem', 'PowerSearchItem', 'Item', 'QAItem')
+
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
         self.checklist_items: List[ChecklistItem] = []
         self.checklist_name: str = ""
-        self.tree: Optional[etree._ElementTree] = None
 
     def parse(self) -> bool:
         """
         Parse the Xbench checklist file.
 
+        The file is streamed with iterparse so only the item currently being
+        read is kept in memory, not the whole checklist tree.
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            parser = etree.XMLParser(strip_cdata=False, remove_blank_text=False)
-            self.tree = etree.parse(str(self.file_path), parser)
-            root = self.tree.getroot()
+            events = etree.iterparse(
+                str(self.file_path),
+                events=('start', 'end'),
+                tag=('ChecklistName',) + self.ITEM_TAGS,
+                strip_cdata=False,
+                remove_blank_text=False
+            )
+
+            checklist_name = None
+            depth = 0  # Number of open item elements
+
+            for event, elem in events:
+                if elem.tag == 'ChecklistName':
+                    if event == 'end' and checklist_name is None:
+                        checklist_name = elem.text or ""
+                    continue
+
+                if event == 'start':
+                    depth += 1
+                    continue
+
+                depth -= 1
+                checklist_item = self._parse_item(elem)
+                if checklist_item:
+                    self.checklist_items.append(checklist_item)
 
-            # Get checklist name
-            name_elem = root.find('.//ChecklistName')
-            if name_elem is not None and name_elem.text:
-                self.checklist_name = name_elem.text
+                # Nested items are parsed with their parent's descendants,
+                # so only free memory once the outermost item is done
+                if depth == 0:
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
 
-            # Find all checklist items
-            # Xbench uses different element names depending on the check type
-            self._parse_checklist_items(root)
+            if checklist_name:
+                self.checklist_name = checklist_name
 
             return True
 
         except Exception as e:
+            # Don't keep items from a partially read file
+            self.checklist_items = []
             print(f"Error parsing Xbench checklist: {e}")
             return False
 
-    def _parse_checklist_items(self, root: etree._Element) -> None:
-        """Extract all checklist items from the XML."""
-
-        # Look for common Xbench item elements
-        # Xbench format varies, but common patterns include:
-        # - ChecklistItem
-        # - PowerSearchItem
-        # - QAItem
-
-        item_paths = [
-            './/ChecklistItem',
-            './/PowerSearchItem',
-            './/Item',
-            './/QAItem'
-        ]
-
-        for xpath in item_paths:
-            for item_elem in root.findall(xpath):
-                checklist_item = self._parse_item(item_elem)
-                if checklist_item:
-                    self.checklist_items.append(checklist_item)
-
     def _parse_item(self, element: etree._Element) -> Optional[ChecklistItem]:
         """Parse a single checklist item element."""
         try:
             # Extract common fields
             item_id = element.get('id', element.get('ID', ''))
 
+            # Index descendants by tag once; the first one in document order
+            # wins, like element.find('.//Tag')
+            children = {}
+            for child in element.iterdescendants():
+                children.setdefault(child.tag, child)
+            attrib = element.attrib
+
             # Name/Description
-            name = self._get_text(element, ['Name', 'Description', 'Text'])
+            name = self._text_from(children, attrib, _NAME_TAGS)
 
             # Search text (the actual pattern)
-            search_text = self._get_text(element, [
-                'SearchText', 'Search', 'Pattern', 'FindText', 'SourceText'
-            ])
+            search_text = self._text_from(children, attrib, _SEARCH_TAGS)
 
             if not search_text:
                 return None  # Must have search text
 
             # Replace text (if this is a find/replace pattern)
-            replace_text = self._get_text(element, [
-                'ReplaceText', 'Replace', 'Replacement', 'TargetText'
-            ])
+            replace_text = self._text_from(children, attrib, _REPLACE_TAGS)
 
             # Regex flag
-            is_regex = self._get_bool(element, [
-                'IsRegEx', 'IsRegex', 'RegEx', 'UseRegex', 'RegularExpression'
-            ])
+            is_regex = self._bool_from(children, attrib, _REGEX_TAGS)
 
             # Case sensitivity
-            case_sensitive = self._get_bool(element, [
-                'CaseSensitive', 'MatchCase', 'CaseMatching'
-            ])
+            case_sensitive = self._bool_from(children, attrib, _CASE_TAGS)
 
             # Where to search
-            search_in_source = self._get_bool(element, [
-                'SearchInSource', 'CheckSource', 'Source'
-            ], default=True)
+            search_in_source = self._bool_from(children, attrib, _SOURCE_TAGS,
+                                              default=True)
 
-            search_in_target = self._get_bool(element, [
-                'SearchInTarget', 'CheckTarget', 'Target'
-            ], default=True)
+            search_in_target = self._bool_from(children, attrib, _TARGET_TAGS,
+                                              default=True)
 
             # Enabled status
-            enabled = self._get_bool(element, [
-                'Enabled', 'Active', 'IsEnabled'
-            ], default=True)
+            enabled = self._bool_from(children, attrib, _ENABLED_TAGS,
+                                     default=True)
 
             # Category/Group
-            category = self._get_text(element, ['Category', 'Group', 'Type'])
+            category = self._text_from(children, attrib, _CATEGORY_TAGS)
 
             # Description
-            description = self._get_text(element, [
-                'Description', 'Comment', 'Notes', 'Help'
-            ])
+            description = self._text_from(children, attrib, _DESCRIPTION_TAGS)
 
             return ChecklistItem(
                 id=item_id or f"item_{len(self.checklist_items)}",
@@ -160,33 +177,33 @@ class XbenchParser:
             print(f"Error parsing checklist item: {e}")
             return None
 
-    def _get_text(self, element: etree._Element, tag_names: List[str]) -> str:
-        """Get text from first matching child element."""
+    def _text_from(self, children: Dict[str, etree._Element], attrib,
+                   tag_names: Tuple[str, ...]) -> str:
+        """Get text from first matching child element or attribute."""
         for tag in tag_names:
-            child = element.find(f'.//{tag}')
+            child = children.get(tag)
             if child is not None and child.text:
                 return child.text.strip()
 
             # Also check as attribute
-            attr = element.get(tag)
+            attr = attrib.get(tag)
             if attr:
                 return attr.strip()
 
         return ""
 
-    def _get_bool(self, element: etree._Element, tag_names: List[str],
-                  default: bool = False) -> bool:
+    def _bool_from(self, children: Dict[str, etree._Element], attrib,
+                   tag_names: Tuple[str, ...], default: bool = False) -> bool:
         """Get boolean value from first matching child element or attribute."""
         for tag in tag_names:
-            child = element.find(f'.//{tag}')
+            child = children.get(tag)
             if child is not None:
-                text = (child.text or '').lower().strip()
-                return text in ('true', '1', 'yes', 'on')
+                return (child.text or '').strip().lower() in _TRUTHY
 
             # Check as attribute
-            attr = element.get(tag)
+            attr = attrib.get(tag)
             if attr:
-                return attr.lower().strip() in ('true', '1', 'yes', 'on')
+                return attr.strip().lower() in _TRUTHY
 
         return default
 
@@ -200,8 +217,9 @@ class XbenchParser:
 
     def get_items_by_category(self, category: str) -> List[ChecklistItem]:
         """Get items filtered by category."""
+        category = category.lower()
         return [item for item in self.checklist_items
-                if item.category and item.category.lower() == category.lower()]
+                if item.category and item.category.lower() == category]
 
     def export_as_patterns(self) -> List[Dict[str, str]]:
         """
@@ -213,31 +231,42 @@ class XbenchParser:
         """
         patterns = []
 
-        for item in self.get_enabled_items():
-            if item.is_regex:
-                pattern_dict = {
-                    'name': item.name,
-                    'pattern': item.search_text,
-                    'replacement': item.replace_text or '',
-                    'case_sensitive': item.case_sensitive,
-                    'search_source': item.search_in_source,
-                    'search_target': item.search_in_target,
-                    'category': item.category or 'Uncategorized'
-                }
+        # Single pass over the items instead of filtering get_enabled_items()
+        for item in self.checklist_items:
+            if not (item.enabled and item.is_regex):
+                continue
+
+            pattern_dict = {
+                'name': item.name,
+                'pattern': item.search_text,
+                'replacement': item.replace_text or '',
+                'case_sensitive': item.case_sensitive,
+                'search_source': item.search_in_source,
+                'search_target': item.search_in_target,
+                'category': item.category or 'Uncategorized'
+            }
 
-                if item.description:
-                    pattern_dict['description'] = item.description
+            if item.description:
+                pattern_dict['description'] = item.description
 
-                patterns.append(pattern_dict)
+            patterns.append(pattern_dict)
 
         return patterns
 
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about the checklist."""
+        regex_items = enabled_items = with_replacement = 0
+        for item in self.checklist_items:
+            if item.is_regex:
+                regex_items += 1
+            if item.enabled:
+                enabled_items += 1
+            if item.replace_text:
+                with_replacement += 1
+
         return {
             'total_items': len(self.checklist_items),
-            'regex_items': len(self.get_regex_items()),
-            'enabled_items': len(self.get_enabled_items()),
-            'with_replacement': sum(1 for item in self.checklist_items
-                                   if item.replace_text)
+            'regex_items': regex_items,
+            'enabled_items': enabled_items,
+            'with_replacement': with_replacement
         }
@@ -3,13 +3,19 @@ XLIFF Parser for handling XLIFF, MQXLIFF, and SDLXLIFF files.
 Preserves XML structure and tags while enabling regex operations on translatable content.
 """
 
+import re
 from lxml import etree
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+# SDLXLIFF <mrk> wrappers and <g> group tags, opening and closing, stripped
+# from display text in a single pass
+_WRAPPER_TAGS = re.compile(r'<(?:mrk|g)\s+[^>]*>|</(?:mrk|g)>')
+
+
+@dataclass(slots=True)
 class TransUnit:
     """Represents a translation unit with source and target segments."""
     id: str
@@ -17,16 +23,30 @@ class TransUnit:
     target: Optional[etree._Element]
     element: etree._Element  # Reference to the original trans-unit element
     tms_metadata: Optional[Dict[str, str]] = None  # TMS integration metadata
+    ns_clark: Optional[str] = None  # "{namespace}" of the file, for new target tags
+    # (element, text) of the last extraction. The element is compared by
+    # identity, so assigning a new source/target is picked up; changing an
+    # element's content in place other than via set_target_text() is not.
+    _source_cache: Optional[Tuple[etree._Element, str]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _target_cache: Optional[Tuple[etree._Element, str]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def get_source_text(self) -> str:
         """Extract text content from source, preserving inline tags."""
-        return self._get_text_with_tags(self.source)
+        cache = self._source_cache
+        if cache is None or cache[0] is not self.source:
+            cache = self._source_cache = (self.source, self._get_text_with_tags(self.source))
+        return cache[1]
 
     def get_target_text(self) -> str:
         """Extract text content from target, preserving inline tags."""
         if self.target is None:
             return ""
-        return self._get_text_with_tags(self.target)
+        cache = self._target_cache
+        if cache is None or cache[0] is not self.target:
+            cache = self._target_cache = (self.target, self._get_text_with_tags(self.target))
+        return cache[1]
 
     def _get_text_with_tags(self, element: etree._Element) -> str:
         """
@@ -38,30 +58,31 @@ class TransUnit:
             return ""
 
         # Use tostring to get inner content, then extract from root element wrapper
-        # This preserves both tags and text properly
-        content = etree.tostring(element, encoding='unicode', method='xml')
-
-        # Extract content between opening and closing tags
-        tag_name = etree.QName(element).localname
+        # This preserves both tags and text properly. Children can't be
+        # serialized one by one instead: each would get its own xmlns
+        # declarations, which the wrapper's inner content doesn't have.
+        content = etree.tostring(element, encoding='unicode', method='xml',
+                                 with_tail=False)
+
+        # Extract content between opening and closing tags. Without the tail
+        # the closing tag is normally the very end of the string.
+        tag_name = element.tag.rpartition('}')[2]  # Local name without {ns}
+        end_tag = f'</{tag_name}>'
         start_tag_end = content.find('>')
-        end_tag_start = content.rfind(f'</{tag_name}>')
+        if content.endswith(end_tag):
+            end_tag_start = len(content) - len(end_tag)
+        else:
+            end_tag_start = content.rfind(end_tag)
 
         if start_tag_end >= 0 and end_tag_start > start_tag_end:
             inner_content = content[start_tag_end + 1:end_tag_start]
 
             # Strip SDLXLIFF <mrk> wrapper tags and <g> group tags
             # These are formatting wrappers that shouldn't be shown in UI
-            import re
-            # Remove opening <mrk> tags (SDLXLIFF)
-            inner_content = re.sub(r'<mrk\s+[^>]*>', '', inner_content)
-            # Remove closing </mrk> tags
-            inner_content = re.sub(r'</mrk>', '', inner_content)
-            # Remove opening <g> tags (group tags)
-            inner_content = re.sub(r'<g\s+[^>]*>', '', inner_content)
-            # Remove closing </g> tags
-            inner_content = re.sub(r'</g>', '', inner_content)
-
-            return inner_content
+            # Plain-text segments have no tags at all, so skip the regex
+            if '<' not in inner_content:
+                return inner_content
+            return _WRAPPER_TAGS.sub('', inner_content)
 
         return ""
 
@@ -72,14 +93,23 @@ class TransUnit:
         """
         if self.target is None:
             # Create target element if it doesn't exist
-            self.target = etree.SubElement(self.element,
-                                          f"{{{self.element.nsmap[None]}}}target")
+            ns_clark = self.ns_clark
+            if ns_clark is None:
+                ns_clark = f"{{{self.element.nsmap[None]}}}"
+            self.target = etree.SubElement(self.element, f"{ns_clark}target")
 
         # Clear existing content
+        self._target_cache = None
         self.target.clear()
         self.target.text = None
         self.target.tail = None
 
+        # Plain text without markup, entities or CRs (which the XML parser
+        # would normalize) parses to itself, so skip the parser for it
+        if new_text and '<' not in new_text and '&' not in new_text and '\r' not in new_text:
+            self.target.text = new_text
+            return
+
         # Parse and insert new content
         try:
             # Wrap in temporary element to parse fragment
@@ -119,6 +149,8 @@ class XLIFFParser:
         self.root: Optional[etree._Element] = None
         self.trans_units: List[TransUnit] = []
         self.phrase_job_uid: Optional[str] = None  # For Phrase TMS integration
+        self.default_ns_clark: Optional[str] = None  # "{namespace}" of the parsed file
+        self.read_only = False  # Set by parse_streaming(); such files can't be saved
 
     def parse(self) -> bool:
         """
@@ -135,22 +167,17 @@ class XLIFFParser:
             nsmap = self.root.nsmap
             default_ns = nsmap.get(None, self.XLIFF_NAMESPACES['xliff'])
 
+            # Compile the lookups used for every trans-unit once per file
+            self._compile_xpaths(default_ns)
+
             # Extract Phrase/Memsource job UID from file element for TMS integration
-            file_elements = self.root.xpath(".//ns:file", namespaces={'ns': default_ns})
+            file_elements = self._xp_file(self.root)
             if file_elements:
-                file_elem = file_elements[0]
-                # Check for Memsource/Phrase job-uid attribute
-                for attr_name, attr_value in file_elem.attrib.items():
-                    if 'job-uid' in attr_name:
-                        self.phrase_job_uid = attr_value
-                        break
+                self._read_phrase_job_uid(file_elements[0])
 
             # Find all trans-unit elements
             # These can be in different locations depending on XLIFF variant
-            trans_unit_xpath = ".//ns:trans-unit"
-            namespaces = {'ns': default_ns}
-
-            for tu_element in self.root.xpath(trans_unit_xpath, namespaces=namespaces):
+            for tu_element in self._xp_trans_unit(self.root):
                 trans_units = self._parse_trans_unit(tu_element, default_ns)
                 if trans_units:
                     # _parse_trans_unit now returns a list
@@ -162,6 +189,80 @@ class XLIFFParser:
             print(f"Error parsing XLIFF file: {e}")
             return False
 
+    def parse_streaming(self) -> bool:
+        """
+        Parse the XLIFF file in a single streaming pass, for read-only use.
+
+        Trans-units are parsed as soon as their end tag is read instead of
+        being collected with XPath from the finished tree. File headers, which
+        in SDLXLIFF embed the original document and skeleton, are discarded
+        once read, so the result can't be saved. Trans-unit elements are kept
+        because TransUnit objects reference them.
+
+        Returns True if successful, False otherwise.
+        """
+        try:
+            events = etree.iterparse(
+                str(self.file_path),
+                events=('start', 'end'),
+                tag=('{*}file', '{*}header', '{*}trans-unit'),
+                strip_cdata=False,
+                remove_blank_text=False
+            )
+
+            default_ns = None
+            seen_file = False
+            for event, elem in events:
+                if default_ns is None:
+                    # First event: the root start tag has been read by now
+                    self.root = elem.getroottree().getroot()
+                    default_ns = self.root.nsmap.get(None, self.XLIFF_NAMESPACES['xliff'])
+                    self._compile_xpaths(default_ns)
+                    file_tag = f"{{{default_ns}}}file"
+                    header_tag = f"{{{default_ns}}}header"
+                    trans_unit_tag = f"{{{default_ns}}}trans-unit"
+
+                tag = elem.tag
+                if tag == file_tag:
+                    # Attributes are available on start; only the first file counts
+                    if event == 'start' and not seen_file:
+                        seen_file = True
+                        self._read_phrase_job_uid(elem)
+                elif event == 'end':
+                    if tag == trans_unit_tag:
+                        self.trans_units.extend(self._parse_trans_unit(elem, default_ns))
+                    elif tag == header_tag:
+                        elem.clear()
+
+            if self.root is not None:
+                self.tree = self.root.getroottree()
+            self.read_only = True
+            return True
+
+        except Exception as e:
+            # Don't keep units from a partially read file
+            self.trans_units = []
+            print(f"Error parsing XLIFF file: {e}")
+            return False
+
+    def _read_phrase_job_uid(self, file_elem: etree._Element) -> None:
+        """Store the Memsource/Phrase job-uid attribute of a <file> element, if any."""
+        for attr_name, attr_value in file_elem.attrib.items():
+            if 'job-uid' in attr_name:
+                self.phrase_job_uid = attr_value
+                break
+
+    def _compile_xpaths(self, namespace: str) -> None:
+        """Compile the XPath expressions (and tag names) used while parsing, bound to the file's namespace."""
+        namespaces = {'ns': namespace}
+        self._xp_file = etree.XPath(".//ns:file", namespaces=namespaces)
+        self._xp_trans_unit = etree.XPath(".//ns:trans-unit", namespaces=namespaces)
+        self._xp_seg_source = etree.XPath("ns:seg-source", namespaces=namespaces)
+        self._xp_source = etree.XPath("ns:source", namespaces=namespaces)
+        self._xp_target = etree.XPath("ns:target", namespaces=namespaces)
+        self._mrk_tag = f"{{{namespace}}}mrk"
+        self.default_ns_clark = f"{{{namespace}}}"
+
     def _parse_trans_unit(self, element: etree._Element, namespace: str) -> List[TransUnit]:
         """Parse a single trans-unit element. Returns a list of TransUnit objects.
         For SDLXLIFF with <mrk mtype="seg"> sub-segments, returns multiple TransUnits.
@@ -169,50 +270,60 @@ class XLIFFParser:
         try:
             tu_id = element.get('id', '')
 
-            # Extract TMS metadata from trans-unit attributes
+            # Extract TMS metadata from trans-unit attributes in one pass
             tms_metadata = {}
+            para_id = None
             for attr_name, attr_value in element.attrib.items():
                 # Lingotek: lgtk:task-segment-url
                 if 'task-segment-url' in attr_name:
                     tms_metadata['lingotek_url'] = attr_value
                     tms_metadata['tms_type'] = 'lingotek'
-                # Phrase: Add support if needed in future
-                elif 'phrase' in attr_name.lower() and 'segment-url' in attr_name.lower():
-                    tms_metadata['phrase_url'] = attr_value
-                    tms_metadata['tms_type'] = 'phrase'
+                else:
+                    # Phrase: Add support if needed in future
+                    attr_lower = attr_name.lower()
+                    if 'phrase' in attr_lower and 'segment-url' in attr_lower:
+                        tms_metadata['phrase_url'] = attr_value
+                        tms_metadata['tms_type'] = 'phrase'
+
+                # Memsource/Phrase m:para-id - the ID Phrase uses for navigation
+                if para_id is None and 'para-id' in attr_name:
+                    para_id = attr_value
 
             # Phrase/Memsource: Build URL from job-uid and para-id
-            if not tms_metadata and self.phrase_job_uid:
-                # Look for m:para-id attribute - this is the ID Phrase uses for navigation
-                para_id = None
-                for attr_name, attr_value in element.attrib.items():
-                    if 'para-id' in attr_name:
-                        para_id = attr_value
-                        break
-
-                if para_id is not None:
-                    # Phrase URL format: https://cloud.memsource.com/web/job/{job-uid}/translate#{para-id}
-                    phrase_url = f"https://cloud.memsource.com/web/job/{self.phrase_job_uid}/translate#{para_id}"
-                    tms_metadata['phrase_url'] = phrase_url
-                    tms_metadata['tms_type'] = 'phrase'
+            if not tms_metadata and self.phrase_job_uid and para_id is not None:
+                # Phrase URL format: https://cloud.memsource.com/web/job/{job-uid}/translate#{para-id}
+                phrase_url = f"https://cloud.memsource.com/web/job/{self.phrase_job_uid}/translate#{para_id}"
+                tms_metadata['phrase_url'] = phrase_url
+                tms_metadata['tms_type'] = 'phrase'
 
             # Only include tms_metadata if we found something
             tms_data = tms_metadata if tms_metadata else None
 
-            # Find source and target elements
-            namespaces = {'ns': namespace, 'sdl': self.XLIFF_NAMESPACES['sdl']}
-
+            # Find source and target elements (XPaths compiled in parse())
             # Check if this is SDLXLIFF format (has seg-source)
-            seg_source = element.find("ns:seg-source", namespaces=namespaces)
+            seg_source = self._first(self._xp_seg_source(element))
 
             if seg_source is not None:
-                # SDLXLIFF: check for <mrk mtype="seg"> sub-segments
-                mrk_segments = seg_source.findall(".//ns:mrk[@mtype='seg']", namespaces=namespaces)
+                # SDLXLIFF: check for <mrk mtype="seg"> sub-segments. These can
+                # sit inside <g> tags, so search all descendants, not just
+                # children; a tag-filtered iterdescendants() beats the XPath.
+                mrk_segments = [mrk for mrk in seg_source.iterdescendants(self._mrk_tag)
+                                if mrk.get('mtype') == 'seg']
 
                 if mrk_segments:
                     # Split into multiple segments based on <mrk> tags
                     trans_units = []
-                    target = element.find("ns:target", namespaces=namespaces)
+                    target = self._first(self._xp_target(element))
+
+                    # Index the target's <mrk> elements by mid once instead of
+                    # searching the target again for every segment. The first
+                    # one in document order wins, as with find().
+                    target_mrk_by_mid = {}
+                    if target is not None:
+                        for target_mrk in target.iterdescendants(self._mrk_tag):
+                            target_mid = target_mrk.get('mid')
+                            if target_mid:
+                                target_mrk_by_mid.setdefault(target_mid, target_mrk)
 
                     for mrk in mrk_segments:
                         mid = mrk.get('mid', '')
@@ -228,14 +339,13 @@ class XLIFFParser:
 
                         # Find corresponding <mrk> in target
                         target_copy = None
-                        if target is not None:
-                            target_mrk = target.find(f".//ns:mrk[@mid='{mid}']", namespaces=namespaces)
-                            if target_mrk is not None:
-                                target_copy = etree.Element(target.tag, nsmap=target.nsmap)
-                                target_copy.text = target_mrk.text
-                                target_copy.tail = target_mrk.tail
-                                for child in target_mrk:
-                                    target_copy.append(child)
+                        target_mrk = target_mrk_by_mid.get(mid)
+                        if target_mrk is not None:
+                            target_copy = etree.Element(target.tag, nsmap=target.nsmap)
+                            target_copy.text = target_mrk.text
+                            target_copy.tail = target_mrk.tail
+                            for child in target_mrk:
+                                target_copy.append(child)
 
                         # Use mid as the segment ID
                         trans_units.append(TransUnit(
@@ -243,7 +353,8 @@ class XLIFFParser:
                             source=source_copy,
                             target=target_copy,
                             element=element,  # Keep reference to parent trans-unit
-                            tms_metadata=tms_data
+                            tms_metadata=tms_data,
+                            ns_clark=self.default_ns_clark
                         ))
 
                     return trans_units
@@ -252,9 +363,9 @@ class XLIFFParser:
                     source = seg_source
             else:
                 # Standard XLIFF: use source
-                source = element.find("ns:source", namespaces=namespaces)
+                source = self._first(self._xp_source(element))
 
-            target = element.find("ns:target", namespaces=namespaces)
+            target = self._first(self._xp_target(element))
 
             if source is None:
                 return []
@@ -264,13 +375,19 @@ class XLIFFParser:
                 source=source,
                 target=target,
                 element=element,
-                tms_metadata=tms_data
+                tms_metadata=tms_data,
+                ns_clark=self.default_ns_clark
             )]
 
         except Exception as e:
             print(f"Error parsing trans-unit: {e}")
             return []
 
+    @staticmethod
+    def _first(elements: List[etree._Element]) -> Optional[etree._Element]:
+        """Get the first element of an XPath result, like element.find()."""
+        return elements[0] if elements else None
+
     def get_trans_units(self) -> List[TransUnit]:
         """Get all parsed translation units."""
         return self.trans_units
@@ -280,6 +397,10 @@ class XLIFFParser:
         Save the modified XLIFF file.
         If output_path is None, overwrites the original file.
         """
+        if self.read_only:
+            print("Error saving XLIFF file: it was parsed read-only with parse_streaming()")
+            return False
+
         try:
             save_path = output_path if output_path else str(self.file_path)
 
@@ -299,9 +420,11 @@ class XLIFFParser:
 
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about the XLIFF file."""
+        total = len(self.trans_units)
+        translated = sum(1 for tu in self.trans_units if tu.target is not None)
         stats = {
-            'total_units': len(self.trans_units),
-            'translated': sum(1 for tu in self.trans_units if tu.target is not None),
-            'untranslated': sum(1 for tu in self.trans_units if tu.target is None)
+            'total_units': total,
+            'translated': translated,
+            'untranslated': total - translated
         }
         return stats
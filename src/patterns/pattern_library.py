@@ -3,13 +3,33 @@ Pattern Library for common regex patterns used in translation/localization.
 Inspired by common QA checks in CAT tools like Xbench, Verifika, and ApSIC.
 """
 
+import functools
 import json
+import sys
+import regex
 from pathlib import Path
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
+try:
+    import orjson  # Optional: faster load/save of large pattern libraries
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: str, flags: int):
+    """Compile a pattern once per (pattern, flags) for the whole process."""
+    return regex.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=512)
+def _template(replacement: str) -> str:
+    """Convert $1-style backreferences to \\1, as the replace command does."""
+    return regex.sub(r'\$(\d+)', r'\\\1', replacement)
+
+
+@dataclass(slots=True)
 class Pattern:
     """Represents a regex pattern with metadata."""
     name: str
@@ -20,18 +40,66 @@ class Pattern:
     case_sensitive: bool = False
     enabled: bool = True
     tags: List[str] = None
+    # Lowercased search fields, so search_patterns() doesn't redo this for
+    # every pattern on every query. Set in __post_init__, left out of to_dict().
+    _name_lower: str = field(default="", init=False, repr=False, compare=False)
+    _desc_lower: str = field(default="", init=False, repr=False, compare=False)
+    _tags_lower: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+        # Saved libraries may carry "category": null
+        if self.category is None:
+            self.category = "General"
+        # Categories and tags repeat across patterns; share one string each
+        if isinstance(self.category, str):
+            self.category = sys.intern(self.category)
+        self.tags = [sys.intern(tag) if isinstance(tag, str) else tag
+                     for tag in self.tags]
+        self._name_lower = self.name.lower()
+        self._desc_lower = self.description.lower()
+        self._tags_lower = [tag.lower() for tag in self.tags]
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        data = asdict(self)
+        for key in ('_name_lower', '_desc_lower', '_tags_lower'):
+            del data[key]
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Pattern':
         return cls(**data)
 
+    def compiled(self):
+        """
+        Get the compiled regex for this pattern, honouring case_sensitive.
+
+        Raises:
+            regex.error: If the pattern is invalid
+        """
+        return _compile(self.pattern, 0 if self.case_sensitive else regex.IGNORECASE)
+
+    def apply(self, text: str) -> str:
+        """
+        Apply this pattern's replacement to plain text.
+
+        Returns:
+            The new text, or the text unchanged if the pattern or
+            replacement is invalid
+        """
+        try:
+            return self.compiled().sub(_template(self.replacement), text)
+        except regex.error:
+            return text
+
+    def search(self, text: str):
+        """Iterate over this pattern's matches in text (none if the pattern is invalid)."""
+        try:
+            return self.compiled().finditer(text)
+        except regex.error:
+            return iter(())
+
 
 class PatternLibrary:
     """
@@ -50,12 +118,22 @@ class PatternLibrary:
         if library_path:
             self.library_path = Path(library_path)
         else:
-            # Default: .patterns/library.json in project root
-            self.library_path = Path.home() / '.xliff_regex_tool' / 'patterns.json'
+            self.library_path = self.default_library_path()
 
         self.patterns: List[Pattern] = []
+        # Name/category/tag indexes, built on first lookup and dropped
+        # whenever the pattern list changes
+        self._by_name: Optional[Dict[str, Pattern]] = None
+        self._by_category: Optional[Dict[str, List[Pattern]]] = None
+        self._by_tag: Optional[Dict[str, List[Pattern]]] = None
+        self._enabled: Optional[List[Pattern]] = None
         self._load_builtin_patterns()
 
+    @staticmethod
+    def default_library_path() -> Path:
+        """Get the default location of the custom patterns file."""
+        return Path.home() / '.xliff_regex_tool' / 'patterns.json'
+
     def _load_builtin_patterns(self):
         """Load built-in patterns for common translation issues."""
 
@@ -293,22 +371,33 @@ class PatternLibrary:
             if not self.library_path.exists():
                 return False
 
-            with open(self.library_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Add custom patterns (don't overwrite built-in)
+            if orjson is not None:
+                data = orjson.loads(self.library_path.read_bytes())
+            else:
+                with open(self.library_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+            # Add custom patterns (don't overwrite built-in). The list changes
+            # inside the loop, so track names locally instead of through the
+            # lazily built index.
+            by_name: Dict[str, Pattern] = {}
+            for existing in self.patterns:
+                by_name.setdefault(existing.name, existing)
             for pattern_data in data.get('patterns', []):
                 pattern = Pattern.from_dict(pattern_data)
                 # Check if pattern with same name exists
-                existing = self.get_pattern_by_name(pattern.name)
+                existing = by_name.get(pattern.name)
                 if existing:
                     # Update existing
                     self.patterns.remove(existing)
                 self.patterns.append(pattern)
+                by_name[pattern.name] = pattern
 
+            self._invalidate_indexes()
             return True
 
         except Exception as e:
+            self._invalidate_indexes()
             print(f"Error loading custom patterns: {e}")
             return False
 
@@ -321,8 +410,12 @@ class PatternLibrary:
                 'patterns': [p.to_dict() for p in self.patterns]
             }
 
-            with open(self.library_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 without escaping, like ensure_ascii=False
+            if orjson is not None:
+                self.library_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.library_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
             return True
 
@@ -338,6 +431,7 @@ class PatternLibrary:
             return False
 
         self.patterns.append(pattern)
+        self._invalidate_indexes()
         return True
 
     def remove_pattern(self, name: str) -> bool:
@@ -345,27 +439,60 @@ class PatternLibrary:
         pattern = self.get_pattern_by_name(name)
         if pattern:
             self.patterns.remove(pattern)
+            self._invalidate_indexes()
             return True
         return False
 
+    def _invalidate_indexes(self) -> None:
+        """Drop the lookup indexes after the pattern list changed."""
+        self._by_name = None
+        self._by_category = None
+        self._by_tag = None
+        self._enabled = None
+
+    def _build_indexes(self) -> None:
+        """Index patterns by name, category, tag and enabled state in a single pass."""
+        by_name: Dict[str, Pattern] = {}
+        by_category: Dict[str, List[Pattern]] = {}
+        by_tag: Dict[str, List[Pattern]] = {}
+        enabled: List[Pattern] = []
+        for pattern in self.patterns:
+            # setdefault: the first pattern with a name wins, as in a scan
+            by_name.setdefault(pattern.name, pattern)
+            by_category.setdefault(pattern.category, []).append(pattern)
+            if pattern.enabled:
+                enabled.append(pattern)
+            # dict.fromkeys so a repeated tag lists the pattern only once
+            for tag in dict.fromkeys(pattern.tags):
+                by_tag.setdefault(tag, []).append(pattern)
+        self._by_name = by_name
+        self._by_category = by_category
+        self._by_tag = by_tag
+        self._enabled = enabled
+
     def get_pattern_by_name(self, name: str) -> Optional[Pattern]:
         """Get a pattern by name."""
-        for pattern in self.patterns:
-            if pattern.name == name:
-                return pattern
-        return None
+        if self._by_name is None:
+            self._build_indexes()
+        return self._by_name.get(name)
 
     def get_patterns_by_category(self, category: str) -> List[Pattern]:
         """Get all patterns in a category."""
-        return [p for p in self.patterns if p.category == category]
+        if self._by_category is None:
+            self._build_indexes()
+        return list(self._by_category.get(category, ()))
 
     def get_patterns_by_tag(self, tag: str) -> List[Pattern]:
         """Get all patterns with a specific tag."""
-        return [p for p in self.patterns if tag in p.tags]
+        if self._by_tag is None:
+            self._build_indexes()
+        return list(self._by_tag.get(tag, ()))
 
     def get_enabled_patterns(self) -> List[Pattern]:
         """Get all enabled patterns."""
-        return [p for p in self.patterns if p.enabled]
+        if self._enabled is None:
+            self._build_indexes()
+        return list(self._enabled)
 
     def search_patterns(self, query: str) -> List[Pattern]:
         """Search patterns by name, description, or tags."""
@@ -373,23 +500,24 @@ class PatternLibrary:
         results = []
 
         for pattern in self.patterns:
-            if (query_lower in pattern.name.lower() or
-                query_lower in pattern.description.lower() or
-                any(query_lower in tag.lower() for tag in pattern.tags)):
+            if (query_lower in pattern._name_lower or
+                query_lower in pattern._desc_lower or
+                any(query_lower in tag for tag in pattern._tags_lower)):
                 results.append(pattern)
 
         return results
 
     def get_categories(self) -> List[str]:
         """Get all unique categories."""
-        return sorted(set(p.category for p in self.patterns))
+        if self._by_category is None:
+            self._build_indexes()
+        return sorted(self._by_category)
 
     def get_all_tags(self) -> List[str]:
         """Get all unique tags."""
-        tags = set()
-        for pattern in self.patterns:
-            tags.update(pattern.tags)
-        return sorted(tags)
+        if self._by_tag is None:
+            self._build_indexes()
+        return sorted(self._by_tag)
 
     def list_patterns(self, category: Optional[str] = None,
                      tag: Optional[str] = None,
@@ -408,7 +536,7 @@ class PatternLibrary:
         results = self.patterns
 
         if category:
-            results = [p for p in results if p.category == category]
+            results = self.get_patterns_by_category(category)
 
         if tag:
             results = [p for p in results if tag in p.tags]
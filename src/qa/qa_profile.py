@@ -3,7 +3,7 @@ QA Profile Manager for batch regex checks.
 Handles loading, saving, and executing QA profiles.
 """
 
-import xml.etree.ElementTree as ET
+from lxml import etree
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -67,7 +67,7 @@ class QAProfileManager:
     @staticmethod
     def load_from_xml(xml_path: str) -> QAProfile:
         """Load a QA profile from XML file."""
-        tree = ET.parse(xml_path)
+        tree = etree.parse(str(xml_path))
         root = tree.getroot()
 
         # Parse metadata
@@ -117,34 +117,34 @@ class QAProfileManager:
     @staticmethod
     def save_to_xml(profile: QAProfile, xml_path: str) -> None:
         """Save a QA profile to XML file."""
-        root = ET.Element('qa_profile')
+        root = etree.Element('qa_profile')
 
         # Create metadata
-        metadata = ET.SubElement(root, 'metadata')
-        ET.SubElement(metadata, 'name').text = profile.name
-        ET.SubElement(metadata, 'description').text = profile.description
-        ET.SubElement(metadata, 'language').text = profile.language
-        ET.SubElement(metadata, 'created').text = profile.created or datetime.now().strftime('%Y-%m-%d')
-        ET.SubElement(metadata, 'modified').text = datetime.now().strftime('%Y-%m-%d')
+        metadata = etree.SubElement(root, 'metadata')
+        etree.SubElement(metadata, 'name').text = profile.name
+        etree.SubElement(metadata, 'description').text = profile.description
+        etree.SubElement(metadata, 'language').text = profile.language
+        etree.SubElement(metadata, 'created').text = profile.created or datetime.now().strftime('%Y-%m-%d')
+        etree.SubElement(metadata, 'modified').text = datetime.now().strftime('%Y-%m-%d')
 
         # Create checks
-        checks_elem = ET.SubElement(root, 'checks')
+        checks_elem = etree.SubElement(root, 'checks')
         for check in profile.checks:
-            check_elem = ET.SubElement(checks_elem, 'check')
+            check_elem = etree.SubElement(checks_elem, 'check')
             check_elem.set('order', str(check.order))
             check_elem.set('enabled', str(check.enabled).lower())
 
-            ET.SubElement(check_elem, 'name').text = check.name
-            ET.SubElement(check_elem, 'description').text = check.description
-            ET.SubElement(check_elem, 'pattern').text = check.pattern
-            ET.SubElement(check_elem, 'replacement').text = check.replacement
-            ET.SubElement(check_elem, 'category').text = check.category
-            ET.SubElement(check_elem, 'case_sensitive').text = str(check.case_sensitive).lower()
-            ET.SubElement(check_elem, 'exclude_pattern').text = check.exclude_pattern or ''
+            etree.SubElement(check_elem, 'name').text = check.name
+            etree.SubElement(check_elem, 'description').text = check.description
+            etree.SubElement(check_elem, 'pattern').text = check.pattern
+            etree.SubElement(check_elem, 'replacement').text = check.replacement
+            etree.SubElement(check_elem, 'category').text = check.category
+            etree.SubElement(check_elem, 'case_sensitive').text = str(check.case_sensitive).lower()
+            etree.SubElement(check_elem, 'exclude_pattern').text = check.exclude_pattern or ''
 
         # Write to file with pretty formatting
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space='    ')
+        tree = etree.ElementTree(root)
+        etree.indent(tree, space='    ')
         tree.write(xml_path, encoding='UTF-8', xml_declaration=True)
 
     @staticmethod
@@ -161,8 +161,9 @@ class QAProfileManager:
         profile_list = []
         for xml_file in profiles_path.glob('*_qa_profile.xml'):
             try:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
+                # Parse the whole file, so a truncated or malformed profile
+                # is skipped here rather than failing once it is loaded
+                root = etree.parse(str(xml_file)).getroot()
                 metadata = root.find('metadata')
 
                 profile_list.append({
@@ -3,12 +3,44 @@ Regex processor for XLIFF files.
 Handles regex find & replace operations while preserving XML tags and structure.
 """
 
+import functools
 import re
 import regex  # More powerful regex library with better Unicode support
-from typing import List, Dict, Tuple, Optional, Callable
+from bisect import bisect_left
+from itertools import accumulate
+from typing import List, Dict, Tuple, Optional, Callable, Union, Any
 from dataclasses import dataclass
 from lxml import etree
 
+# Match XML tags at various escaping levels:
+# 1. Regular tags: <tag attr="value">
+# 2. Single-escaped: &lt;tag attr="value"&gt;
+# 3. Double-escaped: &amp;lt;tag attr="value"&amp;gt;
+# We allow HTML entities (&...;) inside tags since they're part of the tag structure.
+# The entities inside exclude the closing &gt; / &amp;gt;, so each tag body
+# can be read only one way and a failed match backtracks linearly.
+_TAG_RE = re.compile(r'(?:<[^<>]*>|&lt;(?:[^&]|&(?!gt;)[a-zA-Z]+;|&#\d+;)*&gt;|&amp;lt;(?:[^&]|&(?!amp;gt;)(?:amp|quot|lt|gt|#\d+);)*&amp;gt;)')
+
+# JavaScript-style backreferences ($1, $2) in replacement strings
+_DOLLAR_RE = re.compile(r'\$(\d+)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert_replacement(replacement: str) -> str:
+    """Convert $1-style backreferences to \\1 once per replacement string."""
+    return _DOLLAR_RE.sub(r'\\\1', replacement)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile(module, pattern: str, flags: int):
+    """
+    Compile a pattern once per (module, pattern, flags) for the whole process.
+
+    Shared by all RegexProcessor instances, so a long-running batch daemon
+    keeps every profile's patterns compiled across requests.
+    """
+    return module.compile(pattern, flags)
+
 
 @dataclass
 class Match:
@@ -45,86 +77,183 @@ class RegexProcessor:
         self.regex_module = regex if use_advanced_regex else re
         self.matches: List[Match] = []
 
+    def compile(self, pattern: Union[str, Any], flags: int = 0):
+        """
+        Compile pattern with this processor's regex module.
+
+        Already compiled patterns are returned unchanged, so callers can compile
+        once and pass the result to find_in_text/replace_in_text for every
+        translation unit.
+
+        Raises:
+            regex.error / re.error: If the pattern is invalid
+        """
+        if isinstance(pattern, str):
+            return _compile(self.regex_module, pattern, flags)
+        return pattern
+
     def find_in_text(self,
                      text: str,
-                     pattern: str,
+                     pattern: Union[str, Any],
                      flags: int = 0,
                      ignore_tags: bool = True,
-                     exclude_pattern: str = None) -> List[Tuple[int, int, str]]:
+                     exclude_pattern: Union[str, Any, None] = None) -> List[Tuple[int, int, str]]:
         """
         Find all matches of pattern in text.
 
         Args:
             text: Text to search in
-            pattern: Regex pattern
-            flags: Regex flags (e.g., re.IGNORECASE)
+            pattern: Regex pattern, or a pattern compiled with compile()
+            flags: Regex flags (e.g., re.IGNORECASE); ignored for compiled patterns
             ignore_tags: If True, don't match inside XML tags
-            exclude_pattern: Optional pattern to exclude from matches
+            exclude_pattern: Optional pattern (string or compiled) to exclude from matches
 
         Returns:
             List of (start, end, matched_text) tuples
         """
         try:
-            if ignore_tags:
-                # Extract text segments without tags for matching
-                text_segments, tag_positions = self._extract_text_segments(text)
-                plain_text = ''.join(text_segments)
+            pattern = self.compile(pattern, flags)
+            if exclude_pattern:
+                exclude_pattern = self.compile(exclude_pattern, flags)
 
-                # Find matches in plain text
-                matches = []
-                for match in self.regex_module.finditer(pattern, plain_text, flags):
-                    matched_text = match.group(0)
+            return [(start, end, match.group(0))
+                    for start, end, match in self._iter_matches(text, pattern, ignore_tags, exclude_pattern)]
 
-                    # Check if this match should be excluded
-                    if exclude_pattern and self.regex_module.match(exclude_pattern, matched_text, flags):
-                        continue
-
-                    # Map back to original position
-                    original_start = self._map_to_original_position(
-                        match.start(), text_segments, tag_positions)
-                    original_end = self._map_to_original_position(
-                        match.end(), text_segments, tag_positions)
-
-                    matches.append((original_start, original_end, matched_text))
+        except Exception as e:
+            print(f"Regex error: {e}")
+            return []
 
-                return matches
-            else:
-                # Simple search in full text (including tags)
-                matches = []
-                for m in self.regex_module.finditer(pattern, text, flags):
-                    matched_text = m.group(0)
+    def _iter_matches(self, text: str, pattern: Any, ignore_tags: bool, exclude_pattern: Any):
+        """
+        Yield (start, end, match) for each match of a compiled pattern in text.
 
-                    # Check if this match should be excluded
-                    if exclude_pattern and self.regex_module.match(exclude_pattern, matched_text, flags):
-                        continue
+        Positions are in the original text; with ignore_tags the match object
+        itself refers to the text without tags.
+        """
+        # Tags always start with '<' or an '&' entity; text without either
+        # has nothing to skip, so plain matching gives the same positions
+        if ignore_tags and ('<' in text or '&' in text):
+            # Extract text segments without tags for matching
+            text_segments, tag_positions = self._extract_text_segments(text)
+            plain_text = ''.join(text_segments)
+            segment_ends, tag_offsets = self._build_position_map(text_segments, tag_positions)
+
+            # Find matches in plain text
+            for match in pattern.finditer(plain_text):
+                # Check if this match should be excluded
+                if exclude_pattern and exclude_pattern.match(match.group(0)):
+                    continue
+
+                # Map back to original position
+                original_start = self._map_to_original_position(
+                    match.start(), segment_ends, tag_offsets)
+                original_end = self._map_to_original_position(
+                    match.end(), segment_ends, tag_offsets)
+
+                yield original_start, original_end, match
+        else:
+            # Simple search in full text (including tags)
+            for match in pattern.finditer(text):
+                # Check if this match should be excluded
+                if exclude_pattern and exclude_pattern.match(match.group(0)):
+                    continue
+
+                start, end = match.span()
+                yield start, end, match
+
+    def find_in_texts(self,
+                      texts: List[str],
+                      pattern: Union[str, Any],
+                      flags: int = 0,
+                      ignore_tags: bool = True,
+                      exclude_pattern: Union[str, Any, None] = None,
+                      indices: Optional[List[int]] = None,
+                      replacement: Optional[str] = None) -> List[Tuple]:
+        """
+        Find all matches of one pattern across many texts in a single call.
 
-                    matches.append((m.start(), m.end(), matched_text))
+        Each text is matched on its own, so anchors and lookarounds behave
+        exactly as in find_in_text. Empty texts are skipped.
 
-                return matches
+        Args:
+            texts: Texts to search in (e.g. the target of every trans-unit)
+            pattern: Regex pattern, or a pattern compiled with compile()
+            flags: Regex flags; ignored for compiled patterns
+            ignore_tags: If True, don't match inside XML tags
+            exclude_pattern: Optional pattern (string or compiled) to exclude from matches
+            indices: Optional ascending list of text indices to search; others are skipped
+            replacement: Optional Python-style template (\\1, \\g<name>) expanded
+                for each match, to preview what replacing it would give
 
+        Returns:
+            List of (text_index, start, end, matched_text) tuples, or with a
+            replacement (text_index, start, end, matched_text, preview) tuples
+            where preview is None if the template could not be expanded
+        """
+        try:
+            pattern = self.compile(pattern, flags)
+            if exclude_pattern:
+                exclude_pattern = self.compile(exclude_pattern, flags)
         except Exception as e:
             print(f"Regex error: {e}")
             return []
 
+        # Bind lookups once; this loop runs for every unit of every check
+        iter_matches = self._iter_matches
+        results = []
+        extend = results.extend
+        for index in (range(len(texts)) if indices is None else indices):
+            text = texts[index]
+            if not text:
+                continue
+            try:
+                if replacement is None:
+                    extend([(index, start, end, match.group(0))
+                            for start, end, match in iter_matches(text, pattern, ignore_tags, exclude_pattern)])
+                else:
+                    extend([(index, start, end, match.group(0), self._expand(match, replacement))
+                            for start, end, match in iter_matches(text, pattern, ignore_tags, exclude_pattern)])
+            except Exception as e:
+                print(f"Regex error: {e}")
+
+        return results
+
+    def _expand(self, match: Any, replacement: str) -> Optional[str]:
+        """Expand a replacement template for one match, or None if it is invalid."""
+        try:
+            return match.expand(replacement)
+        except Exception:
+            return None
+
+    def get_plain_text(self, text: str) -> str:
+        """
+        Return the text content without tags, as matched by find_in_text
+        with ignore_tags=True.
+        """
+        if '<' not in text and '&' not in text:
+            return text
+        text_segments, _ = self._extract_text_segments(text)
+        return ''.join(text_segments)
+
     def replace_in_text(self,
                        text: str,
-                       pattern: str,
+                       pattern: Union[str, Any],
                        replacement: str,
                        flags: int = 0,
                        ignore_tags: bool = True,
                        max_replacements: int = 0,
-                       exclude_pattern: str = None) -> Tuple[str, int]:
+                       exclude_pattern: Union[str, Any, None] = None) -> Tuple[str, int]:
         """
         Replace matches in text while preserving XML tags.
 
         Args:
             text: Text to process
-            pattern: Regex pattern
+            pattern: Regex pattern, or a pattern compiled with compile()
             replacement: Replacement string (supports backreferences like \\1, \\2 or $1, $2)
-            flags: Regex flags
+            flags: Regex flags; ignored for compiled patterns
             ignore_tags: If True, only replace in text content, not in tags
             max_replacements: Maximum number of replacements (0 = unlimited)
-            exclude_pattern: Optional pattern to exclude from replacement
+            exclude_pattern: Optional pattern (string or compiled) to exclude from replacement
 
         Returns:
             Tuple of (new_text, replacement_count)
@@ -132,20 +261,17 @@ class RegexProcessor:
         try:
             # Convert JavaScript-style backreferences ($1, $2) to Python-style (\1, \2)
             # This ensures compatibility with regex library patterns created in the GUI
-            replacement = re.sub(r'\$(\d+)', r'\\\1', replacement)
-            if not ignore_tags:
-                # Simple replacement in full text
-                if max_replacements > 0:
-                    new_text = self.regex_module.sub(
-                        pattern, replacement, text, count=max_replacements, flags=flags)
-                else:
-                    new_text = self.regex_module.sub(
-                        pattern, replacement, text, flags=flags)
+            replacement = _convert_replacement(replacement)
+            pattern = self.compile(pattern, flags)
 
-                count = len(self.regex_module.findall(pattern, text, flags=flags))
-                return new_text, min(count, max_replacements) if max_replacements > 0 else count
+            if not ignore_tags:
+                # Simple replacement in full text; subn counts in the same pass
+                return pattern.subn(replacement, text,
+                                    count=max_replacements if max_replacements > 0 else 0)
 
             # Complex case: preserve tags
+            if exclude_pattern:
+                exclude_pattern = self.compile(exclude_pattern, flags)
             text_segments, tag_positions = self._extract_text_segments(text)
 
             # Process each text segment
@@ -157,21 +283,14 @@ class RegexProcessor:
                 # If exclude pattern is specified, use custom replacement function
                 if exclude_pattern:
                     new_segment, replacements = self._replace_with_exclude(
-                        segment, pattern, replacement, exclude_pattern, flags,
-                        max_replacements - replacements_made if max_replacements > 0 else 0
+                        segment, pattern, replacement, exclude_pattern,
+                        max_count=max_replacements - replacements_made if max_replacements > 0 else 0
                     )
                 else:
+                    # subn reports the replacements actually made, which may
+                    # be fewer than the remaining quota
                     remaining = max_replacements - replacements_made if max_replacements > 0 else 0
-                    count_limit = remaining if remaining > 0 else 0
-
-                    if count_limit > 0:
-                        new_segment = self.regex_module.sub(
-                            pattern, replacement, segment, count=count_limit, flags=flags)
-                        replacements = count_limit
-                    else:
-                        new_segment = self.regex_module.sub(
-                            pattern, replacement, segment, flags=flags)
-                        replacements = len(self.regex_module.findall(pattern, segment, flags=flags))
+                    new_segment, replacements = pattern.subn(replacement, segment, count=remaining)
 
                 text_segments[i] = new_segment
                 replacements_made += replacements
@@ -187,20 +306,18 @@ class RegexProcessor:
 
     def _replace_with_exclude(self,
                              text: str,
-                             pattern: str,
+                             pattern: Any,
                              replacement: str,
-                             exclude_pattern: str,
-                             flags: int = 0,
+                             exclude_pattern: Any,
                              max_count: int = 0) -> Tuple[str, int]:
         """
         Replace matches while excluding certain patterns.
 
         Args:
             text: Text to process
-            pattern: Pattern to find
+            pattern: Compiled pattern to find
             replacement: Replacement string
-            exclude_pattern: Pattern to exclude
-            flags: Regex flags
+            exclude_pattern: Compiled pattern to exclude
             max_count: Maximum replacements
 
         Returns:
@@ -210,18 +327,18 @@ class RegexProcessor:
         last_end = 0
         replacements = 0
 
-        for match in self.regex_module.finditer(pattern, text, flags):
+        for match in pattern.finditer(text):
             matched_text = match.group(0)
 
             # Check if this match should be excluded
-            if self.regex_module.match(exclude_pattern, matched_text, flags):
+            if exclude_pattern.match(matched_text):
                 # Keep the original match
                 result_parts.append(text[last_end:match.end()])
             else:
                 # Do replacement
                 if max_count == 0 or replacements < max_count:
                     result_parts.append(text[last_end:match.start()])
-                    result_parts.append(self.regex_module.sub(pattern, replacement, matched_text, flags=flags))
+                    result_parts.append(pattern.sub(replacement, matched_text))
                     replacements += 1
                 else:
                     result_parts.append(text[last_end:match.end()])
@@ -243,18 +360,16 @@ class RegexProcessor:
             Tuple of (text_segments, tag_positions)
             where tag_positions is list of (start, end, tag_content)
         """
+        # Tags always start with '<' or an '&' entity; without either the
+        # whole text is one segment and the tag scan can be skipped
+        if '<' not in text and '&' not in text:
+            return ([text] if text else []), []
+
         text_segments = []
         tag_positions = []
 
         current_pos = 0
-        # Match XML tags at various escaping levels:
-        # 1. Regular tags: <tag attr="value">
-        # 2. Single-escaped: &lt;tag attr="value"&gt;
-        # 3. Double-escaped: &amp;lt;tag attr="value"&amp;gt;
-        # We allow HTML entities (&...;) inside tags since they're part of the tag structure
-        tag_pattern = r'(?:<[^<>]*>|&lt;(?:[^&]|&[a-zA-Z]+;|&#\d+;)*?&gt;|&amp;lt;(?:[^&]|&(?:amp|quot|lt|gt|#\d+);)*?&amp;gt;)'
-
-        for match in re.finditer(tag_pattern, text):
+        for match in _TAG_RE.finditer(text):
             # Text before tag
             if match.start() > current_pos:
                 text_segments.append(text[current_pos:match.start()])
@@ -270,31 +385,40 @@ class RegexProcessor:
 
         return text_segments, tag_positions
 
+    def _build_position_map(self,
+                            text_segments: List[str],
+                            tag_positions: List[Tuple[int, int, str]]) -> Tuple[List[int], List[int]]:
+        """
+        Precompute cumulative lengths for _map_to_original_position.
+
+        Returns:
+            Tuple of (segment_ends, tag_offsets) where segment_ends[i] is the
+            plain-text end of segment i and tag_offsets[i] the total length of
+            the first i tags
+        """
+        segment_ends = list(accumulate(len(segment) for segment in text_segments))
+        tag_offsets = [0]
+        tag_offsets.extend(accumulate(len(tag_content) for _, _, tag_content in tag_positions))
+        return segment_ends, tag_offsets
+
     def _map_to_original_position(self,
                                   plain_pos: int,
-                                  text_segments: List[str],
-                                  tag_positions: List[Tuple[int, int, str]]) -> int:
+                                  segment_ends: List[int],
+                                  tag_offsets: List[int]) -> int:
         """
         Map position in plain text (without tags) back to original position (with tags).
-        """
-        char_count = 0
-        original_pos = 0
-
-        for i, segment in enumerate(text_segments):
-            if char_count + len(segment) >= plain_pos:
-                # Position is in this segment
-                offset = plain_pos - char_count
-                return original_pos + offset
 
-            char_count += len(segment)
-            original_pos += len(segment)
-
-            # Add tag length if there's a tag after this segment
-            if i < len(tag_positions):
-                tag_start, tag_end, tag_content = tag_positions[i]
-                original_pos += len(tag_content)
+        Uses a binary search over the position map from _build_position_map,
+        so mapping a match costs O(log n) in the number of segments.
+        """
+        # First segment whose end reaches plain_pos; tags before it are skipped
+        i = bisect_left(segment_ends, plain_pos)
+        if i < len(segment_ends):
+            return plain_pos + tag_offsets[min(i, len(tag_offsets) - 1)]
 
-        return original_pos
+        # Past the last segment: end of text content plus trailing tag, if any
+        plain_end = segment_ends[-1] if segment_ends else 0
+        return plain_end + tag_offsets[min(len(segment_ends), len(tag_offsets) - 1)]
 
     def _reconstruct_text(self,
                          text_segments: List[str],
@@ -323,7 +447,7 @@ class RegexProcessor:
             Tuple of (is_valid, error_message)
         """
         try:
-            self.regex_module.compile(pattern)
+            self.compile(pattern)
             return True, ""
         except Exception as e:
             return False, str(e)
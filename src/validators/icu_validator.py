@@ -5,6 +5,7 @@ Validates ICU syntax in translation files from any CAT tool
 """
 
 import re
+from collections import Counter
 from typing import List, Dict, Optional
 
 
@@ -19,9 +20,23 @@ class ICUValidator:
     ICU_KEYWORDS = {'plural', 'select', 'selectordinal'}
     CATEGORY_KEYWORDS = {'zero', 'one', 'two', 'few', 'many', 'other'}
 
+    # {variable, keyword patterns, compiled once. Each keyword keeps its own
+    # scan: [^}]+ can run over a nested "{n, plural" inside "{g, select", so
+    # a single alternation would count only one of the two keywords.
+    KEYWORD_PATTERNS = {keyword: re.compile(r'\{[^}]+,\s*' + keyword + r'\b', re.IGNORECASE)
+                        for keyword in ICU_KEYWORDS}
+    # Category keywords before "{". A match can't overlap one for another
+    # category, so one scan counts them all.
+    CATEGORY_PATTERN = re.compile(r'\b(' + '|'.join(sorted(CATEGORY_KEYWORDS)) + r')\s*\{')
+    VARIABLE_PATTERN = re.compile(r'\{(\w+)\s*,')
+
     @classmethod
     def has_icu_syntax(cls, text: str) -> bool:
         """Check if text contains ICU MessageFormat syntax or ICU-like patterns"""
+        # Both patterns need "{" and ",", so most plain segments stop here
+        # without running a regex
+        if '{' not in text or ',' not in text:
+            return False
         # Check for correct ICU syntax
         if cls.ICU_PATTERN.search(text):
             return True
@@ -45,9 +60,9 @@ class ICUValidator:
         # Look for pattern like {variable, keyword where keyword should not be translated
         for keyword in cls.ICU_KEYWORDS:
             # Find all instances of {word, keyword} pattern in source
-            source_pattern = r'\{[^}]+,\s*' + keyword + r'\b'
-            source_matches = re.findall(source_pattern, source, re.IGNORECASE)
-            target_matches = re.findall(source_pattern, target, re.IGNORECASE)
+            keyword_pattern = cls.KEYWORD_PATTERNS[keyword]
+            source_matches = keyword_pattern.findall(source)
+            target_matches = keyword_pattern.findall(target)
 
             if len(source_matches) > 0 and len(target_matches) == 0:
                 errors.append(f'ICU keyword "{keyword}" is missing or incorrectly translated in target (must remain as "{keyword}")')
@@ -55,15 +70,17 @@ class ICUValidator:
                 errors.append(f'ICU keyword "{keyword}" count mismatch (source: {len(source_matches)}, target: {len(target_matches)})')
 
         # Check 2: Category keywords not changed
+        # Only check categories that appear before { in source
+        source_categories = Counter(cls.CATEGORY_PATTERN.findall(source))
+        target_categories = Counter(cls.CATEGORY_PATTERN.findall(target))
         for category in cls.CATEGORY_KEYWORDS:
-            # Only check categories that appear before { in source
-            source_matches = re.findall(r'\b(' + category + r')\s*\{', source)
-            target_matches = re.findall(r'\b(' + category + r')\s*\{', target)
+            source_count = source_categories[category]
+            target_count = target_categories[category]
 
-            if len(source_matches) > 0 and len(target_matches) == 0:
+            if source_count > 0 and target_count == 0:
                 errors.append(f'Category "{category}" is missing or incorrectly translated in target (must remain as "{category}")')
-            elif len(source_matches) != len(target_matches):
-                errors.append(f'Category "{category}" count mismatch (source: {len(source_matches)}, target: {len(target_matches)})')
+            elif source_count != target_count:
+                errors.append(f'Category "{category}" count mismatch (source: {source_count}, target: {target_count})')
 
         # Check 3: Balanced braces
         source_open = source.count('{')
@@ -81,22 +98,17 @@ class ICUValidator:
             errors.append(f'Brace count differs from source (source: {source_open} pairs, target: {target_open} pairs)')
 
         # Check 4: Variable names should not change
-        source_vars = re.findall(r'\{(\w+)\s*,', source)
-        target_vars = re.findall(r'\{(\w+)\s*,', target)
+        source_vars = cls.VARIABLE_PATTERN.findall(source)
+        target_vars = cls.VARIABLE_PATTERN.findall(target)
 
-        # Check if variable names match
+        # Check if variable names match; a variable used twice in source but
+        # once in target counts as changed too
         if source_vars and target_vars:
-            source_var_set = set(source_vars)
-            target_var_set = set(target_vars)
-
-            changed_vars = source_var_set - target_var_set
+            changed_vars = Counter(source_vars) - Counter(target_vars)
             if changed_vars:
                 errors.append(f'Variable name(s) changed: {", ".join(sorted(changed_vars))} (should not be translated)')
 
-        # Check 5: Comma after variable name
-        source_vars = re.findall(r'\{(\w+)\s*,', source)
-        target_vars = re.findall(r'\{(\w+)\s*,', target)
-
+        # Check 5: Comma after variable name (same variables as check 4)
         if len(source_vars) != len(target_vars):
             errors.append(f'Variable/comma pattern mismatch (check commas after variable names)')
 
@@ -122,13 +134,11 @@ class ICUValidator:
         suggestions = []
 
         # Check for changed variable names
-        source_vars = re.findall(r'\{(\w+)\s*,', source)
-        target_vars = re.findall(r'\{(\w+)\s*,', target)
+        source_vars = cls.VARIABLE_PATTERN.findall(source)
+        target_vars = cls.VARIABLE_PATTERN.findall(target)
 
         if source_vars and target_vars:
-            source_var_set = set(source_vars)
-            target_var_set = set(target_vars)
-            changed_vars = source_var_set - target_var_set
+            changed_vars = Counter(source_vars) - Counter(target_vars)
             if changed_vars:
                 suggestions.append(f'Variable names must match source: {", ".join(sorted(changed_vars))}')
 
@@ -138,10 +148,10 @@ class ICUValidator:
                 suggestions.append(f'Restore ICU keyword: "{keyword}" (not translated)')
 
         # Check for translated categories
+        source_categories = set(cls.CATEGORY_PATTERN.findall(source))
+        target_categories = set(cls.CATEGORY_PATTERN.findall(target))
         for category in cls.CATEGORY_KEYWORDS:
-            source_has = re.search(r'\b' + category + r'\s*\{', source)
-            target_has = re.search(r'\b' + category + r'\s*\{', target)
-            if source_has and not target_has:
+            if category in source_categories and category not in target_categories:
                 suggestions.append(f'Restore category keyword: "{category}" (not translated)')
 
         # Check for offset
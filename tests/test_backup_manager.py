@@ -0,0 +1,126 @@
+"""Tests for BackupManager."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from backup import backup_manager  # noqa: E402
+from backup.backup_manager import BackupManager  # noqa: E402
+
+
+class CreateBackupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.file = os.path.join(self.tmp.name, 'doc.xliff')
+        with open(self.file, 'w', encoding='utf-8') as f:
+            f.write('<xliff/>')
+
+    def test_back_to_back_backups_get_distinct_names(self):
+        # Pin the clock so both backups fall in the same second
+        with mock.patch.object(backup_manager, '_timestamp', return_value='20240101_120000'):
+            manager = BackupManager()
+            first = manager.create_backup(self.file)
+            second = manager.create_backup(self.file)
+
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertNotEqual(first, second)
+        self.assertTrue(os.path.exists(first))
+        self.assertTrue(os.path.exists(second))
+        self.assertEqual(os.path.basename(second), 'doc_backup_20240101_120000-1.xliff')
+        self.assertEqual(sorted(manager.list_backups(self.file)), sorted([first, second]))
+
+    def test_back_to_back_backups_in_backup_dir(self):
+        backup_dir = os.path.join(self.tmp.name, '.backups')
+        with mock.patch.object(backup_manager, '_timestamp', return_value='20240101_120000'):
+            manager = BackupManager(backup_dir)
+            first = manager.create_backup(self.file)
+            second = manager.create_backup(self.file)
+
+        self.assertEqual(os.path.basename(first), 'doc_20240101_120000.xliff')
+        self.assertEqual(os.path.basename(second), 'doc_20240101_120000-1.xliff')
+
+    def test_restore_from_counter_backup_targets_original(self):
+        with mock.patch.object(backup_manager, '_timestamp', return_value='20240101_120000'):
+            manager = BackupManager()
+            manager.create_backup(self.file)
+            second = manager.create_backup(self.file)
+            with open(self.file, 'w', encoding='utf-8') as f:
+                f.write('<changed/>')
+            self.assertTrue(manager.restore_backup(second))
+
+        with open(self.file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '<xliff/>')
+
+
+class FastCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = os.path.join(self.tmp.name, 'doc.xliff')
+        self.dst = os.path.join(self.tmp.name, 'copy.xliff')
+        with open(self.src, 'w', encoding='utf-8') as f:
+            f.write('<xliff/>')
+
+    def test_copy_range_reporting_nothing_falls_back(self):
+        # Some filesystems answer copy_file_range with 0 without copying
+        with mock.patch.object(BackupManager, '_clone', return_value=False), \
+                mock.patch.object(os, 'copy_file_range', return_value=0, create=True):
+            BackupManager._fast_copy(self.src, self.dst)
+
+        with open(self.dst, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '<xliff/>')
+
+
+class RestoreBackupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.file = os.path.join(self.tmp.name, 'doc.xliff')
+
+    def write(self, path, content):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def test_move_aside_keeps_backup_with_the_same_name(self):
+        manager = BackupManager()
+        self.write(self.file, 'current')
+        with mock.patch.object(backup_manager, '_timestamp', return_value='20240101_120000'):
+            taken = manager._new_backup_path(self.file)
+            self.write(taken, 'earlier backup')
+            moved_to = manager._move_aside(self.file)
+
+        self.assertEqual(os.path.basename(moved_to), 'doc_backup_20240101_120000-1.xliff')
+        self.assertEqual(self.read(taken), 'earlier backup')
+        self.assertEqual(self.read(moved_to), 'current')
+        self.assertFalse(os.path.exists(self.file))
+
+    def test_restore_keeps_current_file_as_backup(self):
+        manager = BackupManager()
+        self.write(self.file, 'old')
+        with mock.patch.object(backup_manager, '_timestamp', return_value='20240101_120000'):
+            backup = manager.create_backup(self.file)
+            self.write(self.file, 'new')
+            self.assertTrue(manager.restore_backup(backup))
+
+        self.assertEqual(self.read(self.file), 'old')
+        self.assertEqual(self.read(backup), 'old')
+        contents = sorted(self.read(path) for path in manager.list_backups(self.file))
+        self.assertEqual(contents, ['new', 'old'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Tests for the batch-find check runner in cli."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import cli  # noqa: E402
+from qa.qa_profile import QACheck  # noqa: E402
+from regex_engine.regex_processor import RegexProcessor  # noqa: E402
+
+
+def make_check(order, pattern):
+    return QACheck(order=order, enabled=True, name=f'Check {order}', description='',
+                   pattern=pattern, replacement='', category='Test')
+
+
+class RunChecksTest(unittest.TestCase):
+
+    def run_checks(self, patterns, texts):
+        checks = [make_check(order, pattern) for order, pattern in enumerate(patterns, 1)]
+        return [matches for _, _, _, matches in
+                cli._run_checks(RegexProcessor(), checks, texts)]
+
+    def test_skip_fail_check_does_not_hide_other_matches(self):
+        # (*SKIP)(*F) would act on the whole prefilter alternation
+        results = self.run_checks([r'Oslo(*SKIP)(*F)|\bO\w+', 'Oslo'], ['Oslo'])
+        self.assertEqual(results[1], [(0, 0, 4, 'Oslo')])
+
+    def test_prune_check_does_not_hide_other_matches(self):
+        results = self.run_checks([r'ab(*PRUNE)x|zz', 'a'], ['Oslo ab'])
+        self.assertEqual(results[1], [(0, 5, 6, 'a')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for PatternLibrary."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from patterns.pattern_library import PatternLibrary  # noqa: E402
+
+
+class LoadCustomPatternsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'patterns.json')
+
+    def write_library(self, patterns):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'patterns': patterns}, f)
+
+    def test_null_category_falls_back_to_general(self):
+        self.write_library([{
+            'name': 'Custom null category',
+            'pattern': r'\bfoo\b',
+            'category': None,
+            'tags': None,
+        }])
+
+        library = PatternLibrary(self.path)
+        self.assertTrue(library.load_custom_patterns())
+
+        pattern = library.get_pattern_by_name('Custom null category')
+        self.assertIsNotNone(pattern)
+        self.assertEqual(pattern.category, 'General')
+        self.assertEqual(pattern.tags, [])
+        self.assertIn(pattern, library.get_patterns_by_category('General'))
+        self.assertIn('General', library.get_categories())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for QAProfileManager."""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from qa.qa_profile import QAProfileManager  # noqa: E402
+
+SAMPLE_PROFILE = Path(__file__).resolve().parent.parent / 'samples' / 'example_qa_profile.xml'
+
+
+class ListProfilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_truncated_profile_is_not_listed(self):
+        valid = os.path.join(self.tmp.name, 'valid_qa_profile.xml')
+        shutil.copyfile(SAMPLE_PROFILE, valid)
+
+        # Cut the file off after the metadata, in the middle of the checks
+        data = SAMPLE_PROFILE.read_bytes()
+        cut = data.index(b'</metadata>') + len(b'</metadata>')
+        truncated = os.path.join(self.tmp.name, 'truncated_qa_profile.xml')
+        with open(truncated, 'wb') as f:
+            f.write(data[:cut + (len(data) - cut) // 2])
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            profiles = QAProfileManager.list_profiles(self.tmp.name)
+
+        self.assertEqual([profile['path'] for profile in profiles], [valid])
+        self.assertIn('truncated_qa_profile.xml', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()